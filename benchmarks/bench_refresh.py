@@ -0,0 +1,169 @@
+"""Benchmark the integration against a local fake My Cloud device.
+
+Runs the full path a real install takes: config flow and async_setup_entry,
+coordinator refreshes and entity state updates. It then reports setup time,
+refresh latency and CPU time per refresh for each polling tier, plus
+approximate memory per entity. With `--devices`, that many fake devices
+are added, each with its own serial number, and every tier is refreshed on
+all of them at once.
+
+    python benchmarks/bench_refresh.py --disks 12 --volumes 4 --latency 0.05
+    python benchmarks/bench_refresh.py --devices 5 --error-rate 0.1
+
+Needs Home Assistant and wdnas-client installed in the current environment.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from homeassistant.core import HomeAssistant
+from homeassistant import bootstrap, loader
+from homeassistant.config_entries import ConfigEntries, ConfigEntryState
+from homeassistant.data_entry_flow import FlowResultType
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from fake_nas import FakeNas  # noqa: E402
+
+COMPONENT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "custom_components", "mycloud"
+)
+
+
+async def async_start_hass(config_dir):
+    """Start a bare Home Assistant instance with the integration installed."""
+    os.makedirs(os.path.join(config_dir, "custom_components"))
+    os.symlink(COMPONENT_DIR, os.path.join(config_dir, "custom_components", "mycloud"))
+
+    hass = HomeAssistant(config_dir)
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    hass.config_entries = ConfigEntries(hass, {})
+    await bootstrap.async_load_base_functionality(hass)
+    await hass.async_start()
+    return hass
+
+
+class SetupFailed(Exception):
+    """Raised when a fake device couldn't be added."""
+
+
+async def async_add_nas(hass, host):
+    """Add the fake device at `host` through the config flow and wait for setup."""
+    result = await hass.config_entries.flow.async_init(
+        "mycloud",
+        context={"source": "user"},
+        data={"Host": host, "Username": "admin", "Password": "password"},
+    )
+    await hass.async_block_till_done()
+    if result["type"] != FlowResultType.CREATE_ENTRY:
+        raise SetupFailed(f"config flow for {host} ended with {result.get('errors') or result.get('reason')}")
+    entry = result["result"]
+    if entry.state is not ConfigEntryState.LOADED:
+        raise SetupFailed(f"setup of {host} ended in state {entry.state.value}: {entry.reason}")
+    return entry
+
+
+def _summary(values):
+    values = sorted(values)
+    p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+    return f"mean {statistics.mean(values):8.2f}  p50 {statistics.median(values):8.2f}  p95 {p95:8.2f}"
+
+
+async def async_run(args):
+    # Errors are only injected once every device is set up, so they hit the
+    # refreshes being measured rather than the config flow.
+    fleet = [
+        FakeNas(
+            version=args.version,
+            disks=args.disks,
+            volumes=args.volumes,
+            latency=args.latency,
+            session_lifetime=args.session_lifetime,
+            serial_number=f"NAS-{index:04d}",
+            name=f"MyCloudEX2 {index}",
+        )
+        for index in range(1, args.devices + 1)
+    ]
+    hosts = [await nas.start() for nas in fleet]
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = await async_start_hass(config_dir)
+
+        tracemalloc.start()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            entries = [await async_add_nas(hass, host) for host in hosts]
+        except SetupFailed as err:
+            tracemalloc.stop()
+            await hass.async_stop()
+            for nas in fleet:
+                await nas.stop()
+            raise SystemExit(f"Could not add the fake device: {err}") from err
+        setup_time = time.perf_counter() - start
+        memory_after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        for nas in fleet:
+            nas.error_rate = args.error_rate
+
+        entities = len(hass.states.async_all())
+        tiers = {}
+        for entry in entries:
+            for tier, coordinator in hass.data["mycloud"][entry.entry_id].coordinators.items():
+                tiers.setdefault(tier, []).append(coordinator)
+
+        print(f"{args.devices} x My Cloud v{args.version}: {args.disks} disks, {args.volumes} volumes, "
+              f"{args.latency * 1000:.0f} ms latency, {args.error_rate:.0%} errors, {entities} entities")
+        print(f"setup             {setup_time * 1000:8.2f} ms")
+        print(f"memory per entity {(memory_after - memory_before) / max(entities, 1) / 1024:8.2f} KiB (approx.)")
+
+        for tier, coordinators in tiers.items():
+            wall = []
+            cpu = []
+            stale = 0
+            failed = 0
+            for _ in range(args.refreshes):
+                wall_start = time.perf_counter()
+                cpu_start = time.process_time()
+                await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+                await hass.async_block_till_done()
+                cpu.append((time.process_time() - cpu_start) * 1000)
+                wall.append((time.perf_counter() - wall_start) * 1000)
+                stale += sum(bool(coordinator.stale_endpoints) for coordinator in coordinators)
+                failed += sum(not coordinator.last_update_success for coordinator in coordinators)
+            print(f"{tier:<8} refresh  ms  {_summary(wall)}  stale {stale}  failed {failed}")
+            print(f"{tier:<8} cpu      ms  {_summary(cpu)}")
+
+        for nas in fleet:
+            print(f"{nas.serial_number} requests served: {nas.requests}, logins: {nas.logins}")
+
+        await hass.async_stop()
+    for nas in fleet:
+        await nas.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--version", type=int, choices=(2, 5), default=5, help="NAS API version to emulate")
+    parser.add_argument("--devices", type=int, default=1, help="number of fake devices to add")
+    parser.add_argument("--disks", type=int, default=4)
+    parser.add_argument("--volumes", type=int, default=2)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds added to every request")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests failing with HTTP 500, once set up")
+    parser.add_argument("--session-lifetime", type=float, default=None, help="seconds before sessions expire (403)")
+    parser.add_argument("--refreshes", type=int, default=50, help="refreshes per tier")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    asyncio.run(async_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""A local stand-in for the My Cloud web API used by wdnas_client.
+
+Serves the v2 and v5 login, system_info, system_status, device_info and
+system_version endpoints with configurable latency, error injection, session
+expiry (403) and any number of disks and volumes.
+"""
+import asyncio
+import random
+import secrets
+
+from aiohttp import web
+
+
+class FakeNas:
+    """An aiohttp server emulating one My Cloud device.
+
+    :latency: Seconds added to every request.
+    :error_rate: Fraction of requests answered with HTTP 500.
+    :failing: Endpoint names that always answer with HTTP 500.
+    :session_lifetime: Seconds after which a login session is rejected with 403.
+    :sleeping: Report every disk as asleep.
+    :serial_number: Serial number of the device; disk serials are derived from it.
+    :name: Device name.
+    """
+
+    def __init__(
+        self,
+        version=5,
+        disks=2,
+        volumes=1,
+        latency=0.0,
+        error_rate=0.0,
+        failing=(),
+        session_lifetime=None,
+        sleeping=False,
+        serial_number="NAS-0001",
+        name="MyCloudEX2",
+    ):
+        self.version = version
+        self.disks = disks
+        self.volumes = volumes
+        self.latency = latency
+        self.error_rate = error_rate
+        self.failing = set(failing)
+        self.session_lifetime = session_lifetime
+        self.sleeping = sleeping
+        self.serial_number = serial_number
+        self.name = name
+        self.requests = {}
+        self.logins = 0
+        self.sessions = {}
+        self.cpu = 10
+        self.app = web.Application()
+        self.app.router.add_post("/cgi-bin/login_mgr.cgi", self._login)
+        self.app.router.add_post("/nas/v1/auth", self._login)
+        self.app.router.add_get("/xml/sysinfo.xml", self._sysinfo)
+        self.app.router.add_post("/cgi-bin/status_mgr.cgi", self._status)
+        self.app.router.add_post("/cgi-bin/system_mgr.cgi", self._system)
+        self.runner = None
+        self.port = None
+
+    async def start(self, port=0):
+        """Start serving and return the host string to configure the integration with."""
+        self.runner = web.AppRunner(self.app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return f"127.0.0.1:{self.port}"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    def expire_sessions(self):
+        """Drop every session, so the next request gets a 403."""
+        self.sessions.clear()
+
+    async def _delay(self, name):
+        self.requests[name] = self.requests.get(name, 0) + 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if name in self.failing or (self.error_rate and random.random() < self.error_rate):
+            raise web.HTTPInternalServerError()
+
+    def _check_session(self, request):
+        sid = request.cookies.get("PHPSESSID")
+        loop = asyncio.get_running_loop()
+        if sid not in self.sessions:
+            raise web.HTTPForbidden()
+        if self.session_lifetime is not None and loop.time() - self.sessions[sid] > self.session_lifetime:
+            del self.sessions[sid]
+            raise web.HTTPForbidden()
+
+    async def _login(self, request):
+        await self._delay("login")
+        if (self.version == 2) != (request.path == "/cgi-bin/login_mgr.cgi"):
+            raise web.HTTPNotFound()
+        self.logins += 1
+        sid = secrets.token_hex(8)
+        self.sessions[sid] = asyncio.get_running_loop().time()
+        response = web.Response(text="ok")
+        response.set_cookie("PHPSESSID", sid)
+        if self.version == 2:
+            response.set_cookie("WD-CSRF-TOKEN", secrets.token_hex(8))
+        return response
+
+    async def _sysinfo(self, request):
+        await self._delay("system_info")
+        self._check_session(request)
+        disks = "".join(
+            f"<disk id=\"{i}\"><name>sd{chr(ord('a') + i - 1)}</name><connected>1</connected><vendor>WDC</vendor>"
+            f"<model>WD40EFRX</model><rev>82.00A82</rev><sn>{self.serial_number}-WD{i:04d}</sn><size>4000787030016</size>"
+            f"<failed>0</failed><healthy>1</healthy><removable>0</removable><over_temp>0</over_temp>"
+            f"<temp>{30 + i % 10}</temp><sleep>{int(self.sleeping)}</sleep></disk>"
+            for i in range(1, self.disks + 1)
+        )
+        vols = "".join(
+            f"<vol id=\"{i}\"><name>Volume_{i}</name><label>Volume_{i}</label><encrypted>0</encrypted>"
+            f"<unlocked>1</unlocked><mounted>1</mounted><size>3936473772032</size></vol>"
+            for i in range(1, self.volumes + 1)
+        )
+        body = (
+            f"<config><disks>{disks}</disks><vols>{vols}</vols>"
+            "<total_size>7872947544064</total_size><total_used_size>1234567890</total_used_size>"
+            "<total_unused_size>7871712976174</total_unused_size></config>"
+        )
+        return web.Response(text=body)
+
+    async def _status(self, request):
+        await self._delay("system_status")
+        self._check_session(request)
+        self.cpu = (self.cpu + 7) % 100
+        return web.Response(
+            text=f"<config><cpu>{self.cpu}%</cpu><mem_total>1024000</mem_total><mem_free>512000</mem_free><mem2_total>1GB</mem2_total></config>"
+        )
+
+    async def _system(self, request):
+        form = await request.post()
+        cmd = form.get("cmd")
+        if cmd == "cgi_get_device_info":
+            await self._delay("device_info")
+            self._check_session(request)
+            return web.Response(
+                text=(
+                    f"<config><device_info><serial_number>{self.serial_number}</serial_number><name>{self.name}</name>"
+                    "<description>WD My Cloud EX2 Ultra</description></device_info></config>"
+                )
+            )
+        if cmd == "get_firm_v_xml":
+            await self._delay("system_version")
+            self._check_session(request)
+            return web.Response(text="<config><version><fw>5.26.119</fw><oled>\n</oled></version></config>")
+        raise web.HTTPBadRequest()
@@ -1,41 +1,359 @@
+import asyncio
 import logging
-from homeassistant.core import HomeAssistant
+
+import aiohttp
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
-from .const import DOMAIN, HOST, USERNAME, PASSWORD, VERSION
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, EVENT_HOMEASSISTANT_STOP
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.storage import Store
+
+from wdnas_client import client as nas_client
+
+from .api import MyCloudApi
+from .const import (
+    DOMAIN,
+    HOST,
+    USERNAME,
+    PASSWORD,
+    VERSION,
+    CONF_EVENT_PORT,
+    CONF_IMPORT_STATISTICS,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MAX_STALENESS,
+    CONF_SAMPLE_INTERVAL,
+    CONF_SLEEP_INTERVAL,
+    DEFAULT_EVENT_PORT,
+    DEFAULT_IMPORT_STATISTICS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_STALENESS,
+    DEFAULT_SAMPLE_INTERVAL,
+    DEFAULT_SLEEP_INTERVAL,
+    CONNECTION_LIMIT,
+    CONNECTION_LIMIT_PER_HOST,
+    DATA_CONNECTOR,
+    STORAGE_VERSION,
+    TOPOLOGY_SAVE_DELAY,
+    TIER_DEVICE,
+    TIER_ENDPOINTS,
+    TIER_INFO,
+    TIER_INTERVALS,
+    TIER_STATUS,
+)
+from .coordinator import MyCloudCoordinator, MyCloudData, MyCloudInfoCoordinator, MyCloudStatusCoordinator
+from .entity import volume_key
+from .forecast import StorageForecaster
+from .listener import async_setup_listener
+from .long_term import HourlyStatistics
+from .model import Topology
+from .services import async_setup_services
+from .stats import PollStats
 
 
 _LOGGER = logging.getLogger(__name__)
 
+PLATFORMS = ["sensor", "binary_sensor"]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+def _session_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.session")
+
+
+def _topology_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.topology")
+
+
+def _statistics_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.statistics")
+
+
+def _forecast_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.forecast")
+
+
+def _topology_from_coordinators(coordinators) -> Topology:
+    device_data = coordinators[TIER_DEVICE].data
+    return Topology.from_snapshots(
+        device_data["device_info"],
+        device_data["system_version"],
+        coordinators[TIER_INFO].data["system_info"],
+    )
+
+
+def _async_get_connector(hass: HomeAssistant) -> aiohttp.TCPConnector:
+    """Return the connection pool shared by every My Cloud entry."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    connector = domain_data.get(DATA_CONNECTOR)
+    if connector is None or connector.closed:
+        connector = aiohttp.TCPConnector(
+            limit=CONNECTION_LIMIT,
+            limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        )
+        domain_data[DATA_CONNECTOR] = connector
+
+        async def _async_close_connector(event):
+            await connector.close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_connector)
+    return connector
+
+
+async def _async_migrate_volume_ids(hass: HomeAssistant, entry: ConfigEntry, topology: Topology) -> None:
+    """Qualify volume device identifiers and entity unique ids with the NAS serial number.
+
+    Volume devices used to be identified by the bare volume id, and volume
+    entities by the volume id or name, so volumes of two NAS devices could
+    clash and be merged into one device. The first entry to migrate a merged
+    device keeps it; the others are detached and get their own device.
+    """
+    device_renames = {}
+    unique_id_renames = {}
+    for volume in topology.volumes:
+        key = volume_key(topology, volume.id)
+        device_renames[volume.id] = key
+        for description_key in ("volume_size", "volume_mounted", "volume_unlocked", "volume_encrypted"):
+            new_unique_id = f"{key}_{description_key}"
+            unique_id_renames[f"{volume.id}_{description_key}"] = new_unique_id
+            unique_id_renames[f"{topology.name} {volume.label}_{description_key}"] = new_unique_id
+
+    @callback
+    def _async_migrate_entity(entity_entry: er.RegistryEntry) -> dict | None:
+        if entity_entry.unique_id not in unique_id_renames:
+            return None
+        _LOGGER.debug("Migrating unique id of %s", entity_entry.entity_id)
+        return {"new_unique_id": unique_id_renames[entity_entry.unique_id]}
+
+    await er.async_migrate_entries(hass, entry.entry_id, _async_migrate_entity)
+    entity_registry = er.async_get(hass)
+
+    expected = {topology.serial_number, *device_renames.values()}
+    expected.update(disk.serial for disk in topology.disks)
+    device_registry = dr.async_get(hass)
+    for device in dr.async_entries_for_config_entry(device_registry, entry.entry_id):
+        identifiers = {identifier[1] for identifier in device.identifiers if identifier[0] == DOMAIN}
+        if identifiers & device_renames.keys():
+            device_registry.async_update_device(
+                device.id,
+                new_identifiers={
+                    (DOMAIN, device_renames.get(identifier, identifier)) for identifier in identifiers
+                },
+            )
+        elif len(device.config_entries) > 1 and not identifiers & expected:
+            # Unlink this entry's entities first, or detaching would remove them.
+            for entity_entry in er.async_entries_for_device(entity_registry, device.id, include_disabled_entities=True):
+                if entity_entry.config_entry_id == entry.entry_id:
+                    entity_registry.async_update_entity(entity_entry.entity_id, device_id=None)
+            device_registry.async_update_device(device.id, remove_config_entry_id=entry.entry_id)
+
+
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("Setting up My Cloud integration")
 
-    host = entry.data["Host"]
-    username = entry.data["Username"]
-    password = entry.data["Password"]
-    version = entry.data["Version"]
+    host = entry.data[HOST]
+    username = entry.data[USERNAME]
+    password = entry.data[PASSWORD]
+    version = entry.data[VERSION]
+
+    stats = PollStats()
+
+    # Each entry gets its own session (and cookie jar) on top of the shared pool.
+    session = aiohttp.ClientSession(
+        connector=_async_get_connector(hass),
+        connector_owner=False,
+        cookie_jar=aiohttp.CookieJar(unsafe=True),
+        trace_configs=[stats.trace_config()],
+    )
+
+    # Entries aren't unloaded when Home Assistant stops, so close the session
+    # then too, before the shared pool is closed.
+    async def _async_close_session(event):
+        await session.close()
+
+    entry.async_on_unload(hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_session))
+
+    client = nas_client(username, password, host, version)
+    client.session = session
+
+    max_concurrent = entry.options.get(CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS)
+    api = MyCloudApi(client, max_concurrent, _session_store(hass, entry), stats)
+    await api.async_restore_session()
+
+    max_staleness = entry.options.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS)
+    coordinators = {
+        TIER_STATUS: MyCloudStatusCoordinator(
+            hass,
+            api,
+            TIER_STATUS,
+            TIER_ENDPOINTS[TIER_STATUS],
+            entry.options.get(*TIER_INTERVALS[TIER_STATUS]),
+            max_staleness,
+            entry.options.get(CONF_SAMPLE_INTERVAL, DEFAULT_SAMPLE_INTERVAL),
+        ),
+        TIER_DEVICE: MyCloudCoordinator(
+            hass,
+            api,
+            TIER_DEVICE,
+            TIER_ENDPOINTS[TIER_DEVICE],
+            entry.options.get(*TIER_INTERVALS[TIER_DEVICE]),
+            max_staleness,
+        ),
+    }
+    forecaster = StorageForecaster(_forecast_store(hass, entry))
+    await forecaster.async_load()
+    coordinators[TIER_INFO] = MyCloudInfoCoordinator(
+        hass,
+        api,
+        TIER_INFO,
+        TIER_ENDPOINTS[TIER_INFO],
+        entry.options.get(*TIER_INTERVALS[TIER_INFO]),
+        max_staleness,
+        entry.options.get(CONF_SLEEP_INTERVAL, DEFAULT_SLEEP_INTERVAL),
+        forecaster,
+    )
+
+    topology_store = _topology_store(hass, entry)
+    cached_topology = await topology_store.async_load()
+
+    if cached_topology:
+        # Entities are created from the last known topology straight away and
+        # the first live refresh runs in the background.
+        topology = Topology.from_dict(cached_topology)
+
+        async def _async_first_refresh():
+            await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators.values()))
+
+        entry.async_create_background_task(
+            hass, _async_first_refresh(), f"{DOMAIN}_{entry.entry_id}_first_refresh"
+        )
+    else:
+        try:
+            await asyncio.gather(
+                *(coordinator.async_config_entry_first_refresh() for coordinator in coordinators.values())
+            )
+        except Exception:
+            await session.close()
+            raise
+        topology = _topology_from_coordinators(coordinators)
+        await topology_store.async_save(topology.as_dict())
+
+    # Entries created before the config flow checked the NAS have no unique id.
+    if entry.unique_id is None and not any(
+        other.unique_id == topology.serial_number for other in hass.config_entries.async_entries(DOMAIN)
+    ):
+        hass.config_entries.async_update_entry(entry, unique_id=topology.serial_number)
+
+    await _async_migrate_volume_ids(hass, entry, topology)
 
-    hass.data.setdefault(DOMAIN, {})[HOST] = host
-    hass.data.setdefault(DOMAIN, {})[USERNAME] = username
-    hass.data.setdefault(DOMAIN, {})[PASSWORD] = password
-    hass.data.setdefault(DOMAIN, {})[VERSION] = version
+    data = MyCloudData(
+        api=api,
+        coordinators=coordinators,
+        session=session,
+        topology=topology,
+    )
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = data
+
+    @callback
+    def _async_check_topology():
+        """Keep the cached topology in line with what the NAS reports."""
+        if coordinators[TIER_DEVICE].data is None or coordinators[TIER_INFO].data is None:
+            return
+        topology = _topology_from_coordinators(coordinators)
+        if topology != data.topology:
+            data.topology = topology
+            topology_store.async_delay_save(topology.as_dict, TOPOLOGY_SAVE_DELAY)
+
+    for tier in (TIER_INFO, TIER_DEVICE):
+        entry.async_on_unload(coordinators[tier].async_add_listener(_async_check_topology))
+
+    if entry.options.get(CONF_IMPORT_STATISTICS, DEFAULT_IMPORT_STATISTICS):
+        statistics = HourlyStatistics(hass, _statistics_store(hass, entry))
+        await statistics.async_load()
+
+        recorded = None
+
+        @callback
+        def _async_record_statistics():
+            nonlocal recorded
+            coordinator = coordinators[TIER_INFO]
+            # Listeners also run when an event patches the current snapshot;
+            # only record each refresh once.
+            if (
+                coordinator.data is None
+                or not coordinator.last_update_success
+                or coordinator.data is recorded
+                or "system_info" in coordinator.stale_endpoints
+            ):
+                return
+            recorded = coordinator.data
+            statistics.async_record(data.topology, coordinator.data["system_info"], coordinator.stale_disks)
+
+        entry.async_on_unload(coordinators[TIER_INFO].async_add_listener(_async_record_statistics))
+        _async_record_statistics()
+
+    event_port = entry.options.get(CONF_EVENT_PORT, DEFAULT_EVENT_PORT)
+    if event_port:
+        stop_listener = await async_setup_listener(hass, host, event_port, coordinators[TIER_INFO])
+        if stop_listener is not None:
+            entry.async_on_unload(stop_listener)
+
+    if coordinators[TIER_STATUS].sample_interval:
+        entry.async_on_unload(coordinators[TIER_STATUS].async_start_sampling())
 
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
 
-    await hass.config_entries.async_forward_entry_setups(entry, ["sensor"])
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, ["sensor"])
-    
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
     if unload_ok:
-        pass
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        await data.session.close()
+
+        connector = hass.data[DOMAIN].get(DATA_CONNECTOR)
+        if connector is not None and not any(
+            isinstance(value, MyCloudData) for value in hass.data[DOMAIN].values()
+        ):
+            await connector.close()
+            hass.data[DOMAIN].pop(DATA_CONNECTOR)
 
     return unload_ok
 
 
+async def async_remove_config_entry_device(hass: HomeAssistant, entry: ConfigEntry, device_entry) -> bool:
+    """Allow removing devices for disks and volumes the NAS no longer reports."""
+    topology = hass.data[DOMAIN][entry.entry_id].topology
+    current = {topology.serial_number}
+    current.update(disk.serial for disk in topology.disks)
+    current.update(volume_key(topology, volume.id) for volume in topology.volumes)
+    return not any(
+        identifier[0] == DOMAIN and identifier[1] in current for identifier in device_entry.identifiers
+    )
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove stored data when a config entry is deleted."""
+    await _session_store(hass, entry).async_remove()
+    await _topology_store(hass, entry).async_remove()
+    await _statistics_store(hass, entry).async_remove()
+    await _forecast_store(hass, entry).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await hass.config_entries.async_reload(entry.entry_id)
\ No newline at end of file
+    await hass.config_entries.async_reload(entry.entry_id)
@@ -0,0 +1,284 @@
+import asyncio
+import logging
+import random
+import time
+from functools import partial
+
+from .const import (
+    BREAKER_BASE_DELAY,
+    BREAKER_MAX_DELAY,
+    BREAKER_THRESHOLD,
+    CALL_TIMEOUT,
+    PROBE_ENDPOINT,
+    SESSION_IDLE_TIMEOUT,
+    SESSION_SAVE_DELAY,
+)
+from .stats import PollStats
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _is_auth_error(err):
+    return "403" in str(err)
+
+
+class EndpointsFailed(Exception):
+    """Raised when one or more API endpoints fail during a refresh.
+
+    `data` holds the results of the endpoints that did succeed.
+    """
+
+    def __init__(self, errors, data=None):
+        self.errors = errors
+        self.data = data or {}
+        super().__init__(
+            ", ".join(
+                f"{endpoint}: {str(err) or type(err).__name__}" for endpoint, err in errors.items()
+            )
+        )
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a NAS that is currently considered unreachable."""
+
+    def __init__(self, retry_in):
+        self.retry_in = retry_in
+        super().__init__(f"NAS unreachable, next attempt in {retry_in:.0f}s")
+
+
+class CircuitBreaker:
+    """Stops calling an unreachable NAS until a backoff delay has passed.
+
+    After `threshold` failed refreshes in a row the circuit opens. Once the
+    delay (doubling on every failed probe, with jitter) has passed, one cheap
+    probe is allowed through; if it succeeds the circuit closes again.
+    """
+
+    def __init__(self, threshold=BREAKER_THRESHOLD, base_delay=BREAKER_BASE_DELAY, max_delay=BREAKER_MAX_DELAY):
+        self._threshold = threshold
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self.failures = 0
+        self._retry_at = None
+
+    @property
+    def is_open(self):
+        return self._retry_at is not None
+
+    @property
+    def retry_in(self):
+        if self._retry_at is None:
+            return 0
+        return max(0, self._retry_at - time.monotonic())
+
+    def record_success(self):
+        if self.is_open:
+            _LOGGER.info("NAS reachable again, resuming polling")
+        self.failures = 0
+        self._retry_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures < self._threshold:
+            return
+
+        delay = min(self._max_delay, self._base_delay * 2 ** (self.failures - self._threshold))
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        if not self.is_open:
+            _LOGGER.warning(
+                "NAS unreachable after %s attempts, pausing polling for %.0fs", self.failures, delay
+            )
+        self._retry_at = time.monotonic() + delay
+
+
+class MyCloudApi:
+    """Shares one NAS client between coordinators, bounding concurrent requests.
+
+    The login session is renewed once it has been idle for
+    `SESSION_IDLE_TIMEOUT`, and saved to `store` so it survives restarts. A
+    call rejected with 403 triggers a single re-login and only that call is
+    retried; only those count as re-authentications in the poll stats.
+    Identical calls made while one is already in flight share its result.
+    """
+
+    def __init__(self, client, max_concurrent, store=None, stats=None):
+        self.client = client
+        self._store = store
+        self.stats = stats or PollStats()
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._reauth_lock = asyncio.Lock()
+        self._probe_lock = asyncio.Lock()
+        self._session_generation = 0
+        self.breaker = CircuitBreaker()
+        self._last_used = None
+        self._save_pending = False
+        self._in_flight = {}
+
+    async def async_restore_session(self):
+        """Reuse the persisted session if it is still fresh.
+
+        Otherwise the first fetch logs in.
+        """
+        if self._store is None:
+            return False
+        stored = await self._store.async_load()
+        if not stored or not stored.get("phpsessid"):
+            return False
+        if time.time() - stored.get("last_used", 0) > SESSION_IDLE_TIMEOUT:
+            return False
+
+        cookies = {"PHPSESSID": stored["phpsessid"]}
+        if stored.get("wd_csrf_token"):
+            cookies["WD-CSRF-TOKEN"] = stored["wd_csrf_token"]
+        self.client.session.cookie_jar.update_cookies(cookies)
+        self.client.phpsessid = stored["phpsessid"]
+        self.client.wd_csrf_token = stored.get("wd_csrf_token")
+        self._last_used = stored["last_used"]
+        _LOGGER.debug("Reusing stored session for %s", self.client.host)
+        return True
+
+    async def async_fetch(self, endpoints, track_breaker=True):
+        """Fetch all given endpoints concurrently.
+
+        With `track_breaker` off, as for extra samples between refreshes, the
+        outcome doesn't count towards the circuit breaker.
+        """
+        await self._async_check_breaker()
+
+        if self._session_expiring():
+            try:
+                await self._async_reauthenticate(self._session_generation, renewal=True)
+            except Exception as err:
+                if track_breaker:
+                    self.breaker.record_failure()
+                raise EndpointsFailed({"login": err}) from err
+
+        results = await asyncio.gather(
+            *(self._async_fetch_shared(endpoint) for endpoint in endpoints),
+            return_exceptions=True,
+        )
+
+        data = {}
+        errors = {}
+        for endpoint, result in zip(endpoints, results):
+            if isinstance(result, Exception):
+                errors[endpoint] = result
+            else:
+                data[endpoint] = result
+
+        if track_breaker and errors and not data:
+            self.breaker.record_failure()
+        elif track_breaker:
+            self.breaker.record_success()
+
+        if errors:
+            raise EndpointsFailed(errors, data)
+        return data
+
+    async def _async_fetch_shared(self, endpoint):
+        """Join the identical call already in flight, or start one."""
+        task = self._in_flight.get(endpoint)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(self._async_fetch_endpoint(endpoint))
+            self._in_flight[endpoint] = task
+            task.add_done_callback(partial(self._async_call_done, endpoint))
+        else:
+            _LOGGER.debug("Joining %s call already in flight", endpoint)
+        # Shielded so one caller timing out doesn't cancel the call for the others.
+        return await asyncio.shield(task)
+
+    def _async_call_done(self, endpoint, task):
+        del self._in_flight[endpoint]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller went away.
+            task.exception()
+
+    async def _async_check_breaker(self):
+        """Raise while the circuit is open, letting one probe through once it's due."""
+        if not self.breaker.is_open:
+            return
+        if self.breaker.retry_in:
+            raise CircuitOpenError(self.breaker.retry_in)
+
+        async with self._probe_lock:
+            if not self.breaker.is_open:
+                return
+            if self.breaker.retry_in:
+                raise CircuitOpenError(self.breaker.retry_in)
+            try:
+                await self._async_fetch_shared(PROBE_ENDPOINT)
+            except Exception as err:
+                self.breaker.record_failure()
+                raise CircuitOpenError(self.breaker.retry_in) from err
+            self.breaker.record_success()
+
+    async def _async_call(self, endpoint):
+        """Call a single endpoint, bounded by the configured concurrency."""
+        async with self._semaphore:
+            result = await self._async_timed(endpoint, getattr(self.client, endpoint))
+        self._async_session_used()
+        return result
+
+    async def _async_timed(self, name, call):
+        """Run a client call with a timeout, recording its latency and payload size."""
+        trace = self.stats.start_call()
+        start = time.monotonic()
+        success = False
+        try:
+            async with asyncio.timeout(CALL_TIMEOUT):
+                result = await call()
+            success = True
+            return result
+        finally:
+            self.stats.record_call(name, time.monotonic() - start, success, trace)
+
+    async def _async_fetch_endpoint(self, endpoint):
+        """Call an endpoint, retrying it once after re-authenticating on a 403."""
+        generation = self._session_generation
+        try:
+            return await self._async_call(endpoint)
+        except Exception as err:
+            if not _is_auth_error(err):
+                raise
+
+        await self._async_reauthenticate(generation)
+        _LOGGER.debug("Re-authentication successful. Retrying %s.", endpoint)
+        return await self._async_call(endpoint)
+
+    def _session_expiring(self):
+        return self._last_used is None or time.time() - self._last_used > SESSION_IDLE_TIMEOUT
+
+    def _async_session_used(self):
+        self._last_used = time.time()
+        if self._store is not None and not self._save_pending:
+            # Rescheduling on every use would postpone the save indefinitely.
+            self._save_pending = True
+            self._store.async_delay_save(self._session_to_save, SESSION_SAVE_DELAY)
+
+    def _session_to_save(self):
+        self._save_pending = False
+        return {
+            "phpsessid": self.client.phpsessid,
+            "wd_csrf_token": self.client.wd_csrf_token,
+            "last_used": self._last_used,
+        }
+
+    async def _async_reauthenticate(self, generation, renewal=False):
+        """Log in again, unless another caller already did since `generation`.
+
+        `renewal` marks a planned login for an idle session, which isn't
+        counted as a re-authentication.
+        """
+        async with self._reauth_lock:
+            if generation != self._session_generation:
+                return
+            if not renewal and self._last_used is not None:
+                self.stats.record_reauth()
+            await self._async_login()
+
+    async def _async_login(self):
+        await self._async_timed("login", self.client.login)
+        self._last_used = time.time()
+        self._session_generation += 1
+        if self._store is not None:
+            await self._store.async_save(self._session_to_save())
@@ -0,0 +1,149 @@
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.components.binary_sensor import (
+    DOMAIN as BINARY_SENSOR_DOMAIN,
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
+from homeassistant.components.sensor import DOMAIN as SENSOR_DOMAIN
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN, TIER_INFO
+from .entity import (
+    MyCloudDiskEntity,
+    MyCloudVolumeEntity,
+    async_setup_hardware_entities,
+    disk_device_info,
+    volume_device_info,
+    volume_key,
+)
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, kw_only=True)
+class MyCloudBinarySensorEntityDescription(BinarySensorEntityDescription):
+    """Describes a My Cloud binary sensor; `value_fn` receives the `Disk` or `Volume`."""
+
+    value_fn: Callable[[Any], bool]
+
+
+DISK_BINARY_SENSORS = (
+    MyCloudBinarySensorEntityDescription(
+        key="disk_healthy", name="Healthy", icon="mdi:shield-check", value_fn=lambda disk: disk.healthy
+    ),
+    MyCloudBinarySensorEntityDescription(
+        key="disk_sleep", name="Sleeping", icon="mdi:sleep", value_fn=lambda disk: disk.sleep
+    ),
+    MyCloudBinarySensorEntityDescription(
+        key="disk_failed", name="Failed", icon="mdi:alert", value_fn=lambda disk: disk.failed
+    ),
+    MyCloudBinarySensorEntityDescription(
+        key="disk_over_temp", name="Over Temperature", icon="mdi:thermometer-alert", value_fn=lambda disk: disk.over_temp
+    ),
+)
+
+VOLUME_BINARY_SENSORS = (
+    MyCloudBinarySensorEntityDescription(
+        key="volume_mounted", name="Mounted", icon="mdi:folder-pound", value_fn=lambda volume: volume.mounted
+    ),
+    MyCloudBinarySensorEntityDescription(
+        key="volume_unlocked", name="Unlocked", icon="mdi:lock-open", value_fn=lambda volume: volume.unlocked
+    ),
+    MyCloudBinarySensorEntityDescription(
+        key="volume_encrypted", name="Encrypted", icon="mdi:lock", value_fn=lambda volume: volume.encrypted
+    ),
+)
+
+
+async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities):
+    """Set up the WD My Cloud binary sensor platform."""
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = data.coordinators[TIER_INFO]
+    topology = data.topology
+    registry = er.async_get(hass)
+
+    def _async_add_entities(entities):
+        _async_migrate_from_sensor_domain(registry, config_entry, entities)
+        async_add_entities(entities)
+
+    async_setup_hardware_entities(
+        config_entry,
+        coordinator,
+        topology,
+        _async_add_entities,
+        lambda disk: _disk_binary_sensors(coordinator, topology, disk),
+        lambda volume: _volume_binary_sensors(coordinator, topology, volume),
+    )
+
+
+def _async_migrate_from_sensor_domain(registry, config_entry, entities):
+    """Replace registry entries left over from when these were registered as sensors.
+
+    The new binary_sensor entry keeps the old object id, so automations
+    only need the domain part of the entity id changed.
+    """
+    for entity in entities:
+        old_entity_id = registry.async_get_entity_id(SENSOR_DOMAIN, DOMAIN, entity.unique_id)
+        if old_entity_id is None:
+            continue
+        registry.async_remove(old_entity_id)
+        new_entry = registry.async_get_or_create(
+            BINARY_SENSOR_DOMAIN,
+            DOMAIN,
+            entity.unique_id,
+            suggested_object_id=old_entity_id.split(".", 1)[1],
+            config_entry=config_entry,
+        )
+        _LOGGER.info("Migrated %s to %s", old_entity_id, new_entry.entity_id)
+
+
+def _disk_binary_sensors(coordinator, topology, disk):
+    disk_name = f"{topology.name} Disk {disk.name}"
+    disk_device = disk_device_info(topology, disk)
+    return [
+        MyCloudDiskBinarySensor(coordinator, description, disk_device, disk.serial, disk_name)
+        for description in DISK_BINARY_SENSORS
+    ]
+
+
+def _volume_binary_sensors(coordinator, topology, volume):
+    volume_name = f"{topology.name} {volume.label}"
+    volume_device = volume_device_info(topology, volume)
+    return [
+        MyCloudVolumeBinarySensor(coordinator, description, volume_device, topology, volume.id, volume_name)
+        for description in VOLUME_BINARY_SENSORS
+    ]
+
+
+class MyCloudDiskBinarySensor(MyCloudDiskEntity, BinarySensorEntity):
+    entity_description: MyCloudBinarySensorEntityDescription
+
+    def __init__(self, coordinator, description, device_info, disk_serial, disk_name):
+        super().__init__(coordinator, disk_serial)
+        self.entity_description = description
+        self._attr_device_info = device_info
+        self._attr_unique_id = f"{disk_serial}_{description.key}"
+        self._attr_name = f"{disk_name} {description.name}"
+
+    def _update_from_data(self):
+        self._attr_is_on = self.entity_description.value_fn(self._disk)
+
+class MyCloudVolumeBinarySensor(MyCloudVolumeEntity, BinarySensorEntity):
+    entity_description: MyCloudBinarySensorEntityDescription
+
+    def __init__(self, coordinator, description, device_info, topology, volume_id, volume_name):
+        super().__init__(coordinator, volume_id)
+        self.entity_description = description
+        self._attr_device_info = device_info
+        self._attr_unique_id = f"{volume_key(topology, volume_id)}_{description.key}"
+        self._attr_name = f"{volume_name} {description.name}"
+
+    def _update_from_data(self):
+        self._attr_is_on = self.entity_description.value_fn(self._volume)
@@ -1,7 +1,95 @@
+import asyncio
+import logging
+
+import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import callback
-from .const import DOMAIN
+from wdnas_client import client as nas_client
+from wdnas_client.exceptions import InvalidLoginError, RequestFailedError
+
+from .const import (
+    DOMAIN,
+    HOST,
+    USERNAME,
+    PASSWORD,
+    VERSION,
+    PROBE_TIMEOUT,
+    SUPPORTED_VERSIONS,
+    CONF_UPDATE_INTERVAL,
+    CONF_STATUS_INTERVAL,
+    CONF_DEVICE_INTERVAL,
+    CONF_SLEEP_INTERVAL,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_USAGE_DEADBAND,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_SAMPLE_INTERVAL,
+    CONF_IMPORT_STATISTICS,
+    CONF_EVENT_PORT,
+    CONF_MAX_STALENESS,
+    DEFAULT_UPDATE_INTERVAL,
+    DEFAULT_STATUS_INTERVAL,
+    DEFAULT_DEVICE_INTERVAL,
+    DEFAULT_SLEEP_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_USAGE_DEADBAND,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DEFAULT_SAMPLE_INTERVAL,
+    DEFAULT_IMPORT_STATISTICS,
+    DEFAULT_EVENT_PORT,
+    DEFAULT_MAX_STALENESS,
+    ENDPOINTS,
+    MIN_SAMPLE_INTERVAL,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CannotConnect(Exception):
+    """The NAS could not be reached on any supported API version."""
+
+
+class InvalidAuth(Exception):
+    """The NAS rejected the username or password."""
+
+
+async def _async_probe_version(host, username, password, version):
+    """Log in with one API version and return the device details."""
+    async with aiohttp.ClientSession(cookie_jar=aiohttp.CookieJar(unsafe=True)) as session:
+        client = nas_client(username, password, host, version)
+        client.session = session
+        async with asyncio.timeout(PROBE_TIMEOUT):
+            await client.login()
+            return await client.device_info()
+
+
+def _is_auth_failure(err):
+    if isinstance(err, InvalidLoginError):
+        return True
+    return isinstance(err, RequestFailedError) and any(status in str(err) for status in ("401", "403"))
+
+
+async def async_detect_version(host, username, password):
+    """Probe every supported API version at once and return (version, device details).
+
+    The newest version that logs in and answers wins. Raises InvalidAuth if
+    the NAS rejected the credentials, otherwise CannotConnect.
+    """
+    results = await asyncio.gather(
+        *(_async_probe_version(host, username, password, version) for version in SUPPORTED_VERSIONS),
+        return_exceptions=True,
+    )
+
+    for version, result in sorted(zip(SUPPORTED_VERSIONS, results), reverse=True):
+        if not isinstance(result, Exception):
+            return version, result
+
+    for version, err in zip(SUPPORTED_VERSIONS, results):
+        _LOGGER.debug("Version %s probe of %s failed: %r", version, host, err)
+    if any(_is_auth_failure(err) for err in results):
+        raise InvalidAuth
+    raise CannotConnect
+
 
 class MyCloudOptionsFlowHandler(config_entries.OptionsFlow):
 
@@ -9,19 +97,73 @@ class MyCloudOptionsFlowHandler(config_entries.OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        current_interval = self.config_entry.options.get("update_interval", 600)
+        current_status_interval = self.config_entry.options.get(CONF_STATUS_INTERVAL, DEFAULT_STATUS_INTERVAL)
+        current_interval = self.config_entry.options.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+        current_device_interval = self.config_entry.options.get(CONF_DEVICE_INTERVAL, DEFAULT_DEVICE_INTERVAL)
+        current_sleep_interval = self.config_entry.options.get(CONF_SLEEP_INTERVAL, DEFAULT_SLEEP_INTERVAL)
+        current_concurrency = self.config_entry.options.get(
+            CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+        )
+        current_sample_interval = self.config_entry.options.get(CONF_SAMPLE_INTERVAL, DEFAULT_SAMPLE_INTERVAL)
+        current_import_statistics = self.config_entry.options.get(CONF_IMPORT_STATISTICS, DEFAULT_IMPORT_STATISTICS)
+        current_event_port = self.config_entry.options.get(CONF_EVENT_PORT, DEFAULT_EVENT_PORT)
+        current_max_staleness = self.config_entry.options.get(CONF_MAX_STALENESS, DEFAULT_MAX_STALENESS)
+        current_usage_deadband = self.config_entry.options.get(CONF_USAGE_DEADBAND, DEFAULT_USAGE_DEADBAND)
+        current_temperature_deadband = self.config_entry.options.get(
+            CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+        )
         
         options_schema = vol.Schema({
             vol.Optional(
-                "update_interval", 
+                CONF_STATUS_INTERVAL,
+                default=current_status_interval,
+            ): vol.All(vol.Coerce(int), vol.Range(min=15)),
+            vol.Optional(
+                CONF_SAMPLE_INTERVAL,
+                default=current_sample_interval,
+            ): vol.All(vol.Coerce(int), vol.Any(0, vol.Range(min=MIN_SAMPLE_INTERVAL))),
+            vol.Optional(
+                CONF_UPDATE_INTERVAL, 
                 default=current_interval,
-            ): vol.All(vol.Coerce(int), vol.Range(min=30))
+            ): vol.All(vol.Coerce(int), vol.Range(min=30)),
+            vol.Optional(
+                CONF_SLEEP_INTERVAL,
+                default=current_sleep_interval,
+            ): vol.All(vol.Coerce(int), vol.Range(min=30)),
+            vol.Optional(
+                CONF_DEVICE_INTERVAL,
+                default=current_device_interval,
+            ): vol.All(vol.Coerce(int), vol.Range(min=600)),
+            vol.Optional(
+                CONF_MAX_CONCURRENT_REQUESTS,
+                default=current_concurrency,
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=len(ENDPOINTS))),
+            vol.Optional(
+                CONF_MAX_STALENESS,
+                default=current_max_staleness,
+            ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+            vol.Optional(
+                CONF_USAGE_DEADBAND,
+                default=current_usage_deadband,
+            ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            vol.Optional(
+                CONF_TEMPERATURE_DEADBAND,
+                default=current_temperature_deadband,
+            ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+            vol.Optional(
+                CONF_IMPORT_STATISTICS,
+                default=current_import_statistics,
+            ): bool,
+            vol.Optional(
+                CONF_EVENT_PORT,
+                default=current_event_port,
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=65535)),
         })
 
         return self.async_show_form(
             step_id="init",
             data_schema=options_schema,
-            description_placeholders={"example": "Minimum 30 seconds."}
+            description_placeholders={"example": "CPU/memory minimum 15 seconds, storage minimum 30 seconds, device details minimum 600 seconds."}
         )
 
 class MyCloudConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -32,13 +174,34 @@ class MyCloudConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return MyCloudOptionsFlowHandler()
 
     async def async_step_user(self, user_input=None):
+        errors = {}
         if user_input is not None:
-            return self.async_create_entry(title="WD My Cloud Integration", data=user_input)
+            try:
+                version, device = await async_detect_version(
+                    user_input[HOST], user_input[USERNAME], user_input[PASSWORD]
+                )
+            except InvalidAuth:
+                errors["base"] = "auth"
+            except CannotConnect:
+                errors["base"] = "connection"
+            except Exception:
+                _LOGGER.exception("Unexpected error while probing %s", user_input[HOST])
+                errors["base"] = "unknown"
+            else:
+                data = {
+                    HOST: user_input[HOST],
+                    USERNAME: user_input[USERNAME],
+                    PASSWORD: user_input[PASSWORD],
+                    VERSION: version,
+                }
+                await self.async_set_unique_id(device["serial_number"])
+                self._abort_if_unique_id_configured(updates=data)
+                return self.async_create_entry(title=device["name"] or "WD My Cloud", data=data)
 
+        user_input = user_input or {}
         schema = vol.Schema({
-            vol.Required("Host"): str,
-            vol.Required("Username"): str,
-            vol.Required("Password"): str,
-            vol.Required("Version"): vol.All(vol.Coerce(int), vol.In([2, 5]))
+            vol.Required(HOST, default=user_input.get(HOST, "")): str,
+            vol.Required(USERNAME, default=user_input.get(USERNAME, "")): str,
+            vol.Required(PASSWORD): str,
         })
-        return self.async_show_form(step_id="user", data_schema=schema)
\ No newline at end of file
+        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
@@ -3,4 +3,103 @@ DOMAIN = "mycloud"
 HOST = "Host"
 USERNAME = "Username"
 PASSWORD = "Password"
-VERSION = "Version"
\ No newline at end of file
+VERSION = "Version"
+
+# The config flow logs in with every supported API version in parallel and
+# keeps the one that works.
+SUPPORTED_VERSIONS = (2, 5)
+PROBE_TIMEOUT = 5
+
+CONF_UPDATE_INTERVAL = "update_interval"
+CONF_STATUS_INTERVAL = "status_interval"
+CONF_DEVICE_INTERVAL = "device_interval"
+CONF_SLEEP_INTERVAL = "sleep_interval"
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_USAGE_DEADBAND = "usage_deadband"
+CONF_TEMPERATURE_DEADBAND = "temperature_deadband"
+CONF_SAMPLE_INTERVAL = "sample_interval"
+CONF_IMPORT_STATISTICS = "import_statistics"
+CONF_EVENT_PORT = "event_port"
+CONF_MAX_STALENESS = "max_staleness"
+
+DEFAULT_UPDATE_INTERVAL = 600
+DEFAULT_STATUS_INTERVAL = 60
+DEFAULT_DEVICE_INTERVAL = 21600
+DEFAULT_SLEEP_INTERVAL = 3600
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+DEFAULT_USAGE_DEADBAND = 0.0
+DEFAULT_TEMPERATURE_DEADBAND = 0.0
+DEFAULT_SAMPLE_INTERVAL = 0
+DEFAULT_IMPORT_STATISTICS = False
+DEFAULT_EVENT_PORT = 0
+DEFAULT_MAX_STALENESS = 1800
+
+# Fast CPU/memory sampling, summarised once per status interval. The ring
+# buffer holds at most MAX_WINDOW_SAMPLES samples per metric.
+MIN_SAMPLE_INTERVAL = 5
+MAX_WINDOW_SAMPLES = 720
+SAMPLED_METRICS = ("cpu", "memory")
+
+# Shared HTTP connection pool, reused by every configured NAS.
+DATA_CONNECTOR = "connector"
+# UDP syslog/trap listeners, one per port, shared the same way.
+DATA_LISTENERS = "listeners"
+CONNECTION_LIMIT = 100
+CONNECTION_LIMIT_PER_HOST = DEFAULT_MAX_CONCURRENT_REQUESTS
+
+STORAGE_VERSION = 1
+TOPOLOGY_SAVE_DELAY = 10
+STATISTICS_SAVE_DELAY = 60
+FORECAST_SAVE_DELAY = 60
+
+# Storage growth forecast: samples lose half their weight every
+# FORECAST_HALF_LIFE days, and no trend is reported until the samples span
+# FORECAST_MIN_SPAN days.
+FORECAST_HALF_LIFE = 7
+FORECAST_MIN_SPAN = 0.25
+
+# Hourly statistics not yet imported are dropped after a week.
+MAX_PENDING_HOURS = 168
+
+# The NAS drops sessions that have been idle for a while; log in again
+# before an idle session gets close to that. Each login takes the NAS's only
+# admin session, so a session in regular use is kept rather than renewed.
+SESSION_IDLE_TIMEOUT = 1500
+# The last use of the session is saved this long after it is first used
+# again, and when Home Assistant stops. Kept below SESSION_IDLE_TIMEOUT so
+# the saved session is still live after an unclean restart.
+SESSION_SAVE_DELAY = 600
+
+# Per-call timeout and circuit breaker for unreachable devices.
+CALL_TIMEOUT = 15
+BREAKER_THRESHOLD = 3
+BREAKER_BASE_DELAY = 60
+BREAKER_MAX_DELAY = 1800
+PROBE_ENDPOINT = "system_status"
+
+# Recent call latencies kept per endpoint for the diagnostic sensors.
+LATENCY_SAMPLES = 100
+
+SERVICE_REFRESH = "refresh"
+ATTR_ENDPOINTS = "endpoints"
+# The refresh service skips tiers that refreshed successfully this recently.
+REFRESH_COOLDOWN = 10
+
+ENDPOINTS = ("system_info", "system_status", "device_info", "system_version")
+
+# Polling tiers: live metrics, storage topology and static device details.
+TIER_STATUS = "status"
+TIER_INFO = "info"
+TIER_DEVICE = "device"
+
+TIER_ENDPOINTS = {
+    TIER_STATUS: ("system_status",),
+    TIER_INFO: ("system_info",),
+    TIER_DEVICE: ("device_info", "system_version"),
+}
+
+TIER_INTERVALS = {
+    TIER_STATUS: (CONF_STATUS_INTERVAL, DEFAULT_STATUS_INTERVAL),
+    TIER_INFO: (CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+    TIER_DEVICE: (CONF_DEVICE_INTERVAL, DEFAULT_DEVICE_INTERVAL),
+}
@@ -0,0 +1,235 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import timedelta
+
+import aiohttp
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .api import CircuitOpenError, EndpointsFailed, MyCloudApi
+from .const import MAX_WINDOW_SAMPLES, SAMPLED_METRICS
+from .forecast import StorageForecaster
+from .model import PARSERS, MetricSummary, StorageForecast, Topology
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class MyCloudData:
+    """Runtime data for one config entry."""
+
+    api: MyCloudApi
+    coordinators: dict
+    session: aiohttp.ClientSession
+    topology: Topology
+
+
+class MyCloudCoordinator(DataUpdateCoordinator):
+    """Polls one tier of My Cloud endpoints on its own interval.
+
+    When some endpoints fail, the ones that succeeded are still used and the
+    failed ones keep their last good result, listed in `stale_endpoints`,
+    until they have been failing for longer than `max_staleness` seconds.
+
+    Refreshes that overlap (a poll, a requested refresh, service calls) join
+    the one already running, so each result is only processed once.
+    `refreshed_at` is the monotonic time the last successful refresh ended.
+    """
+
+    def __init__(self, hass: HomeAssistant, api: MyCloudApi, tier: str, endpoints, update_interval: int, max_staleness: int = 0):
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"mycloud_{tier}_coordinator",
+            update_interval=timedelta(seconds=update_interval),
+        )
+        self.api = api
+        self.tier = tier
+        self.endpoints = endpoints
+        self.max_staleness = max_staleness
+        self.stale_endpoints = set()
+        self.refreshed_at = None
+        self._last_good = {}
+        self._failing_since = {}
+        self._refresh_task = None
+        _LOGGER.debug("%s tier update interval set to %s seconds", tier, update_interval)
+
+    async def _async_refresh(self, *args, **kwargs) -> None:
+        if self._refresh_task is None:
+            self._refresh_task = self.hass.async_create_task(
+                self._async_refresh_once(*args, **kwargs), f"{self.name} refresh"
+            )
+        # Callers that are cancelled leave the refresh running for the others.
+        await asyncio.shield(self._refresh_task)
+
+    async def _async_refresh_once(self, *args, **kwargs) -> None:
+        try:
+            await super()._async_refresh(*args, **kwargs)
+        finally:
+            self._refresh_task = None
+        if self.last_update_success:
+            self.refreshed_at = time.monotonic()
+
+    async def _async_update_data(self):
+        """Fetch this tier's endpoints from the device and normalize them."""
+        failure = None
+        try:
+            results = await self.api.async_fetch(self.endpoints)
+        except EndpointsFailed as err:
+            results, failure = err.data, err
+        except CircuitOpenError as err:
+            results, failure = {}, err
+
+        data = {}
+        for endpoint, result in results.items():
+            try:
+                data[endpoint] = PARSERS[endpoint](result)
+            except (KeyError, TypeError) as err:
+                failure = UpdateFailed(f"Unexpected {endpoint} data from device: {err}")
+
+        now = time.monotonic()
+        for endpoint, result in data.items():
+            self._last_good[endpoint] = result
+            self._failing_since.pop(endpoint, None)
+
+        stale_endpoints = set()
+        for endpoint in self.endpoints:
+            if endpoint in data:
+                continue
+            failing_since = self._failing_since.setdefault(endpoint, now)
+            if endpoint not in self._last_good or now - failing_since >= self.max_staleness:
+                raise UpdateFailed(f"Error fetching {self.tier} data: {failure}") from failure
+            data[endpoint] = self._last_good[endpoint]
+            stale_endpoints.add(endpoint)
+
+        if stale_endpoints:
+            _LOGGER.debug("Using last good %s after error: %s", ", ".join(sorted(stale_endpoints)), failure)
+        self.stale_endpoints = stale_endpoints
+        return data
+
+
+class MyCloudInfoCoordinator(MyCloudCoordinator):
+    """Polls storage details, backing off while any disk is asleep.
+
+    Reading disk details can spin up sleeping drives, so while the last known
+    state shows a disk asleep the tier is polled on `sleep_interval` instead.
+    Sleeping disks keep their last awake temperature and size, flagged stale.
+    Each refresh also feeds `forecaster`, whose result is added as "forecast".
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: MyCloudApi,
+        tier: str,
+        endpoints,
+        update_interval: int,
+        max_staleness: int,
+        sleep_interval: int,
+        forecaster: StorageForecaster,
+    ):
+        super().__init__(hass, api, tier, endpoints, update_interval, max_staleness)
+        self.forecaster = forecaster
+        self._forecast = StorageForecast(growth_rate=None, time_to_full=None)
+        self._awake_interval = self.update_interval
+        self._sleep_interval = timedelta(seconds=sleep_interval)
+        self._last_awake = {}
+        self.stale_disks = set()
+        self.disks_asleep = False
+
+    async def _async_update_data(self):
+        data = await super()._async_update_data()
+
+        disks = data["system_info"].disks.values()
+        stale_disks = set()
+        for disk in disks:
+            if not disk.sleep:
+                self._last_awake[disk.serial] = (disk.temp, disk.size)
+            elif disk.serial in self._last_awake:
+                disk.temp, disk.size = self._last_awake[disk.serial]
+                stale_disks.add(disk.serial)
+        self.stale_disks = stale_disks
+
+        self.disks_asleep = any(disk.sleep for disk in disks)
+        interval = self._sleep_interval if self.disks_asleep else self._awake_interval
+        if interval != self.update_interval:
+            _LOGGER.debug("Disk sleep state changed, polling %s tier every %s", self.tier, interval)
+            self.update_interval = interval
+
+        if "system_info" not in self.stale_endpoints:
+            self._forecast = self.forecaster.async_record(data["system_info"])
+        data["forecast"] = self._forecast
+        return data
+
+
+class MyCloudStatusCoordinator(MyCloudCoordinator):
+    """Polls CPU and memory, optionally sampling them faster than it publishes.
+
+    With a `sample_interval` shorter than the update interval, status is
+    fetched every `sample_interval` seconds into a fixed-size ring buffer per
+    metric. Entities are only updated once per update interval, with the
+    current value plus the min, max, mean and p95 of the samples in that
+    window, so short spikes are visible without writing every sample. Only
+    the scheduled poll ends the window; other refreshes publish it so far.
+    """
+
+    def __init__(self, hass: HomeAssistant, api: MyCloudApi, tier: str, endpoints, update_interval: int, max_staleness: int, sample_interval: int):
+        super().__init__(hass, api, tier, endpoints, update_interval, max_staleness)
+        self.sample_interval = sample_interval if 0 < sample_interval < update_interval else 0
+        size = min(MAX_WINDOW_SAMPLES, update_interval // self.sample_interval + 1) if self.sample_interval else 0
+        self._samples = {metric: deque(maxlen=size) for metric in SAMPLED_METRICS}
+        self._sampling = False
+        self._window_ending = False
+
+    def async_start_sampling(self) -> CALLBACK_TYPE:
+        """Start taking samples between refreshes; returns a callback that stops it."""
+        return async_track_time_interval(
+            self.hass,
+            self._async_sample,
+            timedelta(seconds=self.sample_interval),
+            name=f"{self.name} sampling",
+            cancel_on_shutdown=True,
+        )
+
+    def _record(self, status):
+        for metric, samples in self._samples.items():
+            samples.append(getattr(status, metric))
+
+    async def _async_sample(self, now=None):
+        # Samples don't probe or count towards the circuit breaker; only
+        # refreshes do.
+        if self._sampling or self.api.breaker.is_open:
+            return
+        self._sampling = True
+        try:
+            data = await self.api.async_fetch(self.endpoints, track_breaker=False)
+            self._record(PARSERS["system_status"](data["system_status"]))
+        except (CircuitOpenError, EndpointsFailed, KeyError, TypeError) as err:
+            _LOGGER.debug("Skipping %s sample: %s", self.tier, err)
+        finally:
+            self._sampling = False
+
+    async def _handle_refresh_interval(self, _now=None) -> None:
+        self._window_ending = True
+        await super()._handle_refresh_interval(_now)
+
+    async def _async_update_data(self):
+        data = await super()._async_update_data()
+        if not self.sample_interval:
+            return data
+
+        if "system_status" not in self.stale_endpoints:
+            self._record(data["system_status"])
+        data["status_summary"] = {
+            metric: MetricSummary.from_samples(samples) for metric, samples in self._samples.items()
+        }
+        if self._window_ending:
+            self._window_ending = False
+            for samples in self._samples.values():
+                samples.clear()
+        return data
@@ -0,0 +1,35 @@
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, HOST, PASSWORD, USERNAME
+
+TO_REDACT = {HOST, USERNAME, PASSWORD, "serial_number", "serial"}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    """Return diagnostics for a config entry."""
+    data = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "topology": async_redact_data(data.topology.as_dict(), TO_REDACT),
+        "coordinators": {
+            tier: {
+                "update_interval": coordinator.update_interval.total_seconds(),
+                "last_update_success": coordinator.last_update_success,
+                "stale_endpoints": sorted(coordinator.stale_endpoints),
+                "last_exception": repr(coordinator.last_exception) if coordinator.last_exception else None,
+            }
+            for tier, coordinator in data.coordinators.items()
+        },
+        "circuit_breaker": {
+            "open": data.api.breaker.is_open,
+            "failures": data.api.breaker.failures,
+            "retry_in": data.api.breaker.retry_in,
+        },
+        "stats": data.api.stats.as_dict(),
+    }
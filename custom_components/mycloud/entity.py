@@ -0,0 +1,195 @@
+import logging
+
+from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def nas_device_info(topology):
+    return DeviceInfo(
+        identifiers={(DOMAIN, topology.serial_number)},
+        name=topology.name,
+        manufacturer="Western Digital",
+        model=topology.description,
+        sw_version=topology.firmware
+    )
+
+
+def disk_device_info(topology, disk):
+    return DeviceInfo(
+        identifiers={(DOMAIN, disk.serial)},
+        name=f"{topology.name} Disk {disk.name}",
+        manufacturer="Western Digital",
+        model=disk.model,
+        sw_version=topology.firmware,
+        hw_version=disk.rev,
+        via_device=(DOMAIN, topology.serial_number)
+    )
+
+
+def volume_key(topology, volume_id):
+    """Volume ids are only unique per NAS, so qualify them with its serial number."""
+    return f"{topology.serial_number}_{volume_id}"
+
+
+def volume_device_info(topology, volume):
+    return DeviceInfo(
+        identifiers={(DOMAIN, volume_key(topology, volume.id))},
+        name=f"{topology.name} {volume.label}",
+        manufacturer="Western Digital",
+        model="Storage Volume",
+        via_device=(DOMAIN, topology.serial_number)
+    )
+
+
+def async_setup_hardware_entities(entry, coordinator, topology, async_add_entities, disk_entities, volume_entities):
+    """Add entities for every known disk and volume, and for any that appear later.
+
+    `disk_entities` and `volume_entities` build the entities for one disk or
+    volume. The storage coordinator is checked after every refresh, so new
+    hardware shows up without reloading the entry.
+    """
+    known_disks = {disk.serial for disk in topology.disks}
+    known_volumes = {volume.id for volume in topology.volumes}
+
+    entities = []
+    for disk in topology.disks:
+        entities.extend(disk_entities(disk))
+    for volume in topology.volumes:
+        entities.extend(volume_entities(volume))
+    async_add_entities(entities)
+
+    @callback
+    def _async_add_new_hardware():
+        if coordinator.data is None:
+            return
+        system_info = coordinator.data["system_info"]
+
+        new_entities = []
+        for disk in system_info.disks.values():
+            if disk.serial not in known_disks:
+                known_disks.add(disk.serial)
+                new_entities.extend(disk_entities(disk))
+        for volume in system_info.volumes.values():
+            if volume.id not in known_volumes:
+                known_volumes.add(volume.id)
+                new_entities.extend(volume_entities(volume))
+
+        if new_entities:
+            _LOGGER.debug("Adding %s entities for new disks/volumes", len(new_entities))
+            async_add_entities(new_entities)
+
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_hardware))
+    _async_add_new_hardware()
+
+
+class MyCloudEntity(CoordinatorEntity):
+    """Coordinator entity that only writes its state when it changes.
+
+    Numeric values within `deadband` of the last written value count as
+    unchanged, which keeps noisy readings out of the state machine and recorder.
+    """
+
+    def __init__(self, coordinator, deadband=0):
+        super().__init__(coordinator)
+        self._deadband = deadband
+        self._last_written = None
+
+    @property
+    def available(self):
+        return super().available and self.coordinator.data is not None
+
+    def _update_from_data(self):
+        """Cache values derived from the coordinator data.
+
+        Runs once per refresh while the entity is available, so state reads
+        are plain attribute lookups.
+        """
+
+    @property
+    def extra_state_attributes(self):
+        attributes = super().extra_state_attributes
+        if not self.coordinator.stale_endpoints:
+            return attributes
+        return {**(attributes or {}), "stale": True}
+
+    def _tracked_value(self):
+        if isinstance(self, BinarySensorEntity):
+            return self.is_on
+        return self.native_value
+
+    def _snapshot(self):
+        if not self.available:
+            return (False, None, None)
+        return (True, self._tracked_value(), self.extra_state_attributes)
+
+    def _is_unchanged(self, snapshot):
+        if self._last_written is None:
+            return False
+
+        available, value, attributes = snapshot
+        last_available, last_value, last_attributes = self._last_written
+        if available != last_available or attributes != last_attributes:
+            return False
+        if value == last_value:
+            return True
+        if (
+            self._deadband
+            and isinstance(value, (int, float))
+            and isinstance(last_value, (int, float))
+        ):
+            return abs(value - last_value) < self._deadband
+        return False
+
+    async def async_added_to_hass(self):
+        await super().async_added_to_hass()
+        if self.available:
+            self._update_from_data()
+        self._last_written = self._snapshot()
+
+    @callback
+    def _handle_coordinator_update(self):
+        if self.available:
+            self._update_from_data()
+        snapshot = self._snapshot()
+        if self._is_unchanged(snapshot):
+            return
+        self._last_written = snapshot
+        self.async_write_ha_state()
+
+
+class MyCloudDiskEntity(MyCloudEntity):
+    """Entity for one disk, unavailable while the NAS doesn't report that disk."""
+
+    def __init__(self, coordinator, disk_serial, deadband=0):
+        super().__init__(coordinator, deadband)
+        self._disk_serial = disk_serial
+
+    @property
+    def available(self):
+        return super().available and self._disk_serial in self.coordinator.data["system_info"].disks
+
+    @property
+    def _disk(self):
+        return self.coordinator.data["system_info"].disks[self._disk_serial]
+
+
+class MyCloudVolumeEntity(MyCloudEntity):
+    """Entity for one volume, unavailable while the NAS doesn't report that volume."""
+
+    def __init__(self, coordinator, volume_id):
+        super().__init__(coordinator)
+        self._volume_id = volume_id
+
+    @property
+    def available(self):
+        return super().available and self._volume_id in self.coordinator.data["system_info"].volumes
+
+    @property
+    def _volume(self):
+        return self.coordinator.data["system_info"].volumes[self._volume_id]
@@ -0,0 +1,100 @@
+import math
+import time
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .const import FORECAST_HALF_LIFE, FORECAST_MIN_SPAN, FORECAST_SAVE_DELAY
+from .model import StorageForecast
+
+SECONDS_PER_DAY = 86400
+
+
+class GrowthEstimator:
+    """Exponentially weighted online linear regression of a value over time.
+
+    Keeps only weighted means and co-moments, updated in place per sample, so
+    memory is constant and no history needs re-reading. Older samples fade
+    with the given half-life, letting the slope follow changes in usage.
+    """
+
+    __slots__ = ("weight", "mean_t", "mean_y", "cov_ty", "var_t", "first_t", "last_t")
+
+    def __init__(self):
+        self.weight = 0.0
+        self.mean_t = 0.0
+        self.mean_y = 0.0
+        self.cov_ty = 0.0
+        self.var_t = 0.0
+        self.first_t = None
+        self.last_t = None
+
+    def update(self, t, y, half_life):
+        """Add a sample at `t` days."""
+        if self.last_t is not None and t <= self.last_t:
+            return
+        decay = 1.0 if self.last_t is None else math.exp(-(t - self.last_t) * math.log(2) / half_life)
+
+        self.weight = self.weight * decay + 1
+        delta_t = t - self.mean_t
+        self.mean_t += delta_t / self.weight
+        self.mean_y += (y - self.mean_y) / self.weight
+        self.cov_ty = self.cov_ty * decay + delta_t * (y - self.mean_y)
+        self.var_t = self.var_t * decay + delta_t * (t - self.mean_t)
+
+        if self.first_t is None:
+            self.first_t = t
+        self.last_t = t
+
+    @property
+    def slope(self):
+        """Units per day, or None until the samples span long enough to fit a trend."""
+        if self.first_t is None or self.last_t - self.first_t < FORECAST_MIN_SPAN or self.var_t <= 0:
+            return None
+        return self.cov_ty / self.var_t
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        estimator = cls()
+        for name in cls.__slots__:
+            setattr(estimator, name, data[name])
+        return estimator
+
+
+class StorageForecaster:
+    """Forecasts NAS storage growth from every storage refresh.
+
+    The estimator state is saved to `store`, so a restart carries on from
+    where it left off.
+    """
+
+    def __init__(self, store: Store):
+        self._store = store
+        self._used = GrowthEstimator()
+
+    async def async_load(self):
+        stored = await self._store.async_load()
+        if stored:
+            self._used = GrowthEstimator.from_dict(stored["used"])
+
+    @callback
+    def async_record(self, info, now=None) -> StorageForecast:
+        """Feed one storage reading and return the current forecast."""
+        if info.used is None or info.total is None:
+            return StorageForecast(growth_rate=None, time_to_full=None)
+
+        now = time.time() if now is None else now
+        self._used.update(now / SECONDS_PER_DAY, info.used, FORECAST_HALF_LIFE)
+        self._store.async_delay_save(self._data_to_save, FORECAST_SAVE_DELAY)
+
+        growth_rate = self._used.slope
+        time_to_full = None
+        if growth_rate is not None and growth_rate > 0:
+            time_to_full = max(0, info.total - info.used) / growth_rate
+        return StorageForecast(growth_rate=growth_rate, time_to_full=time_to_full)
+
+    def _data_to_save(self):
+        return {"used": self._used.as_dict()}
@@ -0,0 +1,212 @@
+import asyncio
+import logging
+import re
+import time
+from dataclasses import dataclass
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from yarl import URL
+
+from .const import DATA_LISTENERS, DOMAIN
+from .coordinator import MyCloudInfoCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+EVENT_DISK_FAILED = "disk_failed"
+EVENT_DISK_OVER_TEMP = "disk_over_temp"
+EVENT_VOLUME_UNMOUNTED = "volume_unmounted"
+
+_PRIORITY = re.compile(r"^<\d{1,3}>")
+# Alerts as the NAS words them, e.g. "Drive 2 has failed", "Drive Failure:
+# Drive 2", "Drive 3 temperature is too high" or "Volume_1 is not mounted".
+# The alert has to follow the disk or volume directly, so a message that only
+# mentions a disk and, somewhere later, a word like "fail" doesn't count.
+_PATTERNS = (
+    (
+        EVENT_DISK_OVER_TEMP,
+        re.compile(
+            r"\b(?:disk|drive)\s*(\d+)(?:'s)?\s+(?:(?:is|has)\s+)?(?:over[\s_-]?temperature|overheat(?:ed|ing)"
+            r"|temperature\s+(?:is\s+)?(?:too\s+high|critical|exceeds?\b|over\b|above\b))",
+            re.I,
+        ),
+    ),
+    (
+        EVENT_DISK_FAILED,
+        re.compile(
+            r"\b(?:disk|drive)\s*(\d+)\s+(?:has\s+)?failed\b"
+            r"|\b(?:disk|drive)\s*(\d+)\s+SMART\s+(?:test\s+|status\s+)?(?:has\s+)?failed\b"
+            r"|\b(?:disk|drive)\s+failure\s*[:-]\s*(?:disk|drive)\s*(\d+)\b",
+            re.I,
+        ),
+    ),
+    (
+        EVENT_VOLUME_UNMOUNTED,
+        re.compile(
+            r"\b(volume[\s_]?\d+)\s+(?:(?:is|was|has\s+been)\s+)?(?:unmounted|not\s+mounted|failed\s+to\s+mount)\b",
+            re.I,
+        ),
+    ),
+)
+# Recoveries and passed checks mention the same words, but aren't alerts.
+_BENIGN = re.compile(
+    r"\b(?:passed|no\s+(?:\w+\s+)?(?:failures?|errors?)|(?:back|returned)\s+to\s+normal|recovered|restored|resolved|cleared)\b",
+    re.I,
+)
+# SNMP messages are a BER encoded SEQUENCE spanning the whole datagram.
+_SNMP_SEQUENCE = 0x30
+
+
+@dataclass(slots=True)
+class NasEvent:
+    kind: str
+    target: str
+
+
+def is_snmp(data: bytes) -> bool:
+    """Whether a datagram is an SNMP message rather than syslog text."""
+    if len(data) < 2 or data[0] != _SNMP_SEQUENCE:
+        return False
+    if data[1] < 0x80:
+        return data[1] == len(data) - 2
+    size = data[1] & 0x7F
+    return 0 < size <= 4 and int.from_bytes(data[2 : 2 + size], "big") == len(data) - 2 - size
+
+
+def parse_event(message: str) -> NasEvent | None:
+    """Recognise a disk or volume alert in a syslog message."""
+    message = _PRIORITY.sub("", message)
+    if _BENIGN.search(message):
+        return None
+    for kind, pattern in _PATTERNS:
+        if match := pattern.search(message):
+            return NasEvent(kind, next(group for group in match.groups() if group))
+    return None
+
+
+class NasEventProtocol(asyncio.DatagramProtocol):
+    """Receives syslog messages and SNMP traps and routes them by sender address.
+
+    One socket per port is shared by every config entry; each registers a
+    handler for the addresses its NAS sends from.
+    """
+
+    def __init__(self):
+        self.handlers = {}
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        handler = self.handlers.get(addr[0])
+        if handler is None:
+            return
+        handler(data)
+
+
+def _apply_event(coordinator: MyCloudInfoCoordinator, event: NasEvent) -> bool:
+    """Patch the last storage snapshot with an event, returning whether anything changed."""
+    if coordinator.data is None:
+        return False
+    info = coordinator.data["system_info"]
+
+    if event.kind == EVENT_VOLUME_UNMOUNTED:
+        target = event.target.replace(" ", "_").lower()
+        for volume in info.volumes.values():
+            if target in (volume.label.lower(), volume.name.lower()) and volume.mounted:
+                volume.mounted = False
+                return True
+        return False
+
+    # Alerts name the bay ("Drive 2"), which is the disk's id; its name is the device node.
+    for disk in info.disks.values():
+        if disk.id != event.target:
+            continue
+        if event.kind == EVENT_DISK_FAILED and not disk.failed:
+            disk.failed = True
+            disk.healthy = False
+            return True
+        if event.kind == EVENT_DISK_OVER_TEMP and not disk.over_temp:
+            disk.over_temp = True
+            return True
+    return False
+
+
+async def _async_resolve(hass: HomeAssistant, host: str) -> set[str]:
+    hostname = URL(f"http://{host}").host
+    try:
+        infos = await hass.loop.getaddrinfo(hostname, None)
+    except OSError:
+        return {hostname}
+    return {info[4][0] for info in infos}
+
+
+async def async_setup_listener(
+    hass: HomeAssistant, host: str, port: int, coordinator: MyCloudInfoCoordinator
+) -> CALLBACK_TYPE | None:
+    """Listen for alerts from the NAS at `host` on UDP `port`.
+
+    A recognised alert is applied to the storage entities straight away and
+    requests a storage refresh to confirm it. Other syslog messages are
+    ignored. SNMP traps aren't decoded; each requests a storage refresh, but
+    at most one per storage update interval. While disks are asleep neither
+    triggers a refresh, so the sleep interval is kept. Returns a callback
+    that stops listening, or None if the port couldn't be opened.
+    """
+    listeners = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_LISTENERS, {})
+    protocol = listeners.get(port)
+    if protocol is None:
+        try:
+            _, protocol = await hass.loop.create_datagram_endpoint(NasEventProtocol, local_addr=("0.0.0.0", port))
+        except OSError as err:
+            _LOGGER.error("Unable to listen for NAS events on UDP port %s: %s", port, err)
+            return None
+        listeners[port] = protocol
+
+    addresses = await _async_resolve(hass, host)
+
+    last_trap_refresh = None
+
+    @callback
+    def _async_request_refresh():
+        if coordinator.disks_asleep:
+            _LOGGER.debug("Not refreshing %s on an event while disks are asleep", host)
+            return
+        hass.async_create_task(coordinator.async_request_refresh())
+
+    @callback
+    def _async_handle_message(data: bytes):
+        nonlocal last_trap_refresh
+        if is_snmp(data):
+            now = time.monotonic()
+            interval = coordinator.update_interval.total_seconds()
+            _LOGGER.debug("SNMP trap from %s", host)
+            if last_trap_refresh is None or now - last_trap_refresh >= interval:
+                last_trap_refresh = now
+                _async_request_refresh()
+            return
+
+        message = data.decode("utf-8", errors="replace")
+        event = parse_event(message)
+        _LOGGER.debug("Syslog message from %s: %s (%s)", host, message.strip(), event)
+        if event is None:
+            return
+        if _apply_event(coordinator, event):
+            coordinator.async_update_listeners()
+        _async_request_refresh()
+
+    for address in addresses:
+        protocol.handlers[address] = _async_handle_message
+
+    @callback
+    def _async_stop():
+        for address in addresses:
+            if protocol.handlers.get(address) is _async_handle_message:
+                del protocol.handlers[address]
+        if not protocol.handlers:
+            protocol.transport.close()
+            listeners.pop(port, None)
+        if not listeners:
+            hass.data[DOMAIN].pop(DATA_LISTENERS, None)
+
+    return _async_stop
@@ -0,0 +1,122 @@
+import logging
+from datetime import datetime
+
+from homeassistant.const import UnitOfInformation, UnitOfTemperature
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DOMAIN, MAX_PENDING_HOURS, STATISTICS_SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class HourlyStatistics:
+    """Builds hourly min/max/mean statistics in memory and imports them in batches.
+
+    Every refresh adds one sample per statistic to the bucket for the current
+    hour. Once an hour has passed, all completed hours of a statistic are
+    handed to the recorder's external statistics API in a single call.
+    Pending buckets are kept in `store`, so hours that weren't imported
+    before a restart, or while the recorder was unavailable, are imported
+    afterwards.
+    """
+
+    def __init__(self, hass: HomeAssistant, store: Store):
+        self.hass = hass
+        self._store = store
+        # statistic_id -> {"name", "unit", "hours": {hour start timestamp: [min, max, total, count]}}
+        self._pending = {}
+
+    async def async_load(self):
+        stored = await self._store.async_load()
+        if not stored:
+            return
+        for statistic_id, statistic in stored.items():
+            statistic["hours"] = {int(start): bucket for start, bucket in statistic["hours"].items()}
+        self._pending = stored
+
+    @callback
+    def async_record(self, topology, info, stale_disks, now: datetime | None = None):
+        """Add samples from one storage refresh, then import any completed hours."""
+        now = now or dt_util.utcnow()
+        hour = int(now.replace(minute=0, second=0, microsecond=0).timestamp())
+
+        self._add(f"{topology.serial_number}_used_storage", f"{topology.name} Used Storage", UnitOfInformation.BYTES, info.used, hour)
+        for volume in info.volumes.values():
+            self._add(
+                f"{topology.serial_number}_volume_{volume.id}_size",
+                f"{topology.name} {volume.label} Size",
+                UnitOfInformation.BYTES,
+                volume.size,
+                hour,
+            )
+        for disk in info.disks.values():
+            if disk.serial in stale_disks:
+                continue
+            self._add(
+                f"{disk.serial}_temperature",
+                f"{topology.name} Disk {disk.name} Temperature",
+                UnitOfTemperature.CELSIUS,
+                disk.temp,
+                hour,
+            )
+
+        self._async_import_completed(hour)
+        self._store.async_delay_save(self._data_to_save, STATISTICS_SAVE_DELAY)
+
+    def _add(self, key, name, unit, value, hour):
+        if value is None:
+            return
+        statistic = self._pending.setdefault(f"{DOMAIN}:{slugify(key)}", {"name": name, "unit": unit, "hours": {}})
+        statistic["name"] = name
+        bucket = statistic["hours"].get(hour)
+        if bucket is None:
+            statistic["hours"][hour] = [value, value, value, 1]
+            if len(statistic["hours"]) > MAX_PENDING_HOURS:
+                del statistic["hours"][min(statistic["hours"])]
+            return
+        bucket[0] = min(bucket[0], value)
+        bucket[1] = max(bucket[1], value)
+        bucket[2] += value
+        bucket[3] += 1
+
+    @callback
+    def _async_import_completed(self, current_hour):
+        if "recorder" not in self.hass.config.components:
+            return
+
+        from homeassistant.components.recorder.statistics import async_add_external_statistics
+
+        for statistic_id, statistic in self._pending.items():
+            completed = sorted(start for start in statistic["hours"] if start < current_hour)
+            if not completed:
+                continue
+
+            metadata = {
+                "has_mean": True,
+                "has_sum": False,
+                "name": statistic["name"],
+                "source": DOMAIN,
+                "statistic_id": statistic_id,
+                "unit_of_measurement": statistic["unit"],
+            }
+            rows = []
+            for start in completed:
+                low, high, total, count = statistic["hours"].pop(start)
+                rows.append(
+                    {
+                        "start": dt_util.utc_from_timestamp(start),
+                        "min": low,
+                        "max": high,
+                        "mean": total / count,
+                    }
+                )
+            async_add_external_statistics(self.hass, metadata, rows)
+            _LOGGER.debug("Imported %s hours of %s", len(rows), statistic_id)
+
+        for statistic_id in [statistic_id for statistic_id, statistic in self._pending.items() if not statistic["hours"]]:
+            del self._pending[statistic_id]
+
+    def _data_to_save(self):
+        return self._pending
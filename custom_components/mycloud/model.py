@@ -0,0 +1,224 @@
+from dataclasses import asdict, dataclass
+from statistics import fmean, quantiles
+
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True)
+class Disk:
+    id: str
+    name: str
+    serial: str
+    model: str
+    rev: str
+    size: int | None
+    temp: float | None
+    healthy: bool
+    sleep: bool
+    failed: bool
+    over_temp: bool
+
+    @classmethod
+    def from_api(cls, disk: dict) -> "Disk":
+        return cls(
+            id=disk["id"],
+            name=disk["name"],
+            serial=disk["sn"],
+            model=disk["model"],
+            rev=disk["rev"],
+            size=_to_int(disk["size"]),
+            temp=_to_float(disk["temp"]),
+            healthy=disk["healthy"],
+            sleep=disk["sleep"],
+            failed=disk["failed"],
+            over_temp=disk["over_temp"],
+        )
+
+
+@dataclass(slots=True)
+class Volume:
+    id: str
+    name: str
+    label: str
+    size: int | None
+    mounted: bool
+    unlocked: bool
+    encrypted: bool
+
+    @classmethod
+    def from_api(cls, volume: dict) -> "Volume":
+        return cls(
+            id=volume["id"],
+            name=volume["name"],
+            label=volume["label"],
+            size=_to_int(volume["size"]),
+            mounted=volume["mounted"],
+            unlocked=volume["unlocked"],
+            encrypted=volume["encrypted"],
+        )
+
+
+@dataclass(slots=True)
+class SystemInfo:
+    """Storage totals with disks indexed by serial number and volumes by id."""
+
+    total: int | None
+    used: int | None
+    unused: int | None
+    disks: dict[str, Disk]
+    volumes: dict[str, Volume]
+
+    @classmethod
+    def from_api(cls, info: dict) -> "SystemInfo":
+        size = info["size"]
+        disks = (Disk.from_api(disk) for disk in info["disks"])
+        volumes = (Volume.from_api(volume) for volume in info["volumes"])
+        return cls(
+            total=_to_int(size["total"]),
+            used=_to_int(size["used"]),
+            unused=_to_int(size["unused"]),
+            disks={disk.serial: disk for disk in disks},
+            volumes={volume.id: volume for volume in volumes},
+        )
+
+
+@dataclass(slots=True)
+class SystemStatus:
+    cpu: int | None
+    memory: float | None
+
+    @classmethod
+    def from_api(cls, status: dict) -> "SystemStatus":
+        total = status["memory"]["total"]
+        memory = None
+        if total > 0:
+            memory = round(((total - status["memory"]["unused"]) / total) * 100, 2)
+        return cls(cpu=status["cpu"], memory=memory)
+
+
+@dataclass(slots=True)
+class MetricSummary:
+    """Min, max, mean and 95th percentile of the samples taken in one window."""
+
+    min: float
+    max: float
+    mean: float
+    p95: float
+    samples: int
+
+    @classmethod
+    def from_samples(cls, samples) -> "MetricSummary | None":
+        samples = [sample for sample in samples if sample is not None]
+        if not samples:
+            return None
+        p95 = samples[0] if len(samples) == 1 else quantiles(samples, n=20, method="inclusive")[-1]
+        return cls(
+            min=min(samples),
+            max=max(samples),
+            mean=round(fmean(samples), 2),
+            p95=round(p95, 2),
+            samples=len(samples),
+        )
+
+
+@dataclass(slots=True)
+class StorageForecast:
+    """Used storage growth in bytes per day and days until the NAS is full."""
+
+    growth_rate: float | None
+    time_to_full: float | None
+
+
+@dataclass(slots=True)
+class DeviceDetails:
+    serial_number: str
+    name: str
+    description: str
+
+    @classmethod
+    def from_api(cls, device: dict) -> "DeviceDetails":
+        return cls(
+            serial_number=device["serial_number"],
+            name=device["name"],
+            description=device["description"],
+        )
+
+
+@dataclass(slots=True)
+class SystemVersion:
+    firmware: str
+
+    @classmethod
+    def from_api(cls, version: dict) -> "SystemVersion":
+        return cls(firmware=version["firmware"])
+
+
+PARSERS = {
+    "system_info": SystemInfo.from_api,
+    "system_status": SystemStatus.from_api,
+    "device_info": DeviceDetails.from_api,
+    "system_version": SystemVersion.from_api,
+}
+
+
+@dataclass(slots=True)
+class DiskTopology:
+    serial: str
+    name: str
+    model: str
+    rev: str
+
+
+@dataclass(slots=True)
+class VolumeTopology:
+    id: str
+    label: str
+
+
+@dataclass(slots=True)
+class Topology:
+    """The devices and entities a NAS exposes, cached so setup needn't wait on it."""
+
+    serial_number: str
+    name: str
+    description: str
+    firmware: str
+    disks: list[DiskTopology]
+    volumes: list[VolumeTopology]
+
+    @classmethod
+    def from_snapshots(cls, device: DeviceDetails, version: SystemVersion, info: SystemInfo) -> "Topology":
+        return cls(
+            serial_number=device.serial_number,
+            name=device.name,
+            description=device.description,
+            firmware=version.firmware,
+            disks=[DiskTopology(disk.serial, disk.name, disk.model, disk.rev) for disk in info.disks.values()],
+            volumes=[VolumeTopology(volume.id, volume.label) for volume in info.volumes.values()],
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Topology":
+        return cls(
+            serial_number=data["serial_number"],
+            name=data["name"],
+            description=data["description"],
+            firmware=data["firmware"],
+            disks=[DiskTopology(**disk) for disk in data["disks"]],
+            volumes=[VolumeTopology(**volume) for volume in data["volumes"]],
+        )
+
+    def as_dict(self) -> dict:
+        return asdict(self)
@@ -1,459 +1,373 @@
 import logging
-from datetime import timedelta
-from homeassistant.components.sensor import SensorEntity, SensorStateClass, SensorDeviceClass
-from homeassistant.components.binary_sensor import BinarySensorEntity
-from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed, CoordinatorEntity
-from homeassistant.const import UnitOfTemperature, UnitOfInformation
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from typing import Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.helpers.entity import EntityCategory
+from homeassistant.const import PERCENTAGE, UnitOfTemperature, UnitOfInformation, UnitOfTime
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from wdnas_client import client as nas_client
-
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    CONF_IMPORT_STATISTICS,
+    CONF_TEMPERATURE_DEADBAND,
+    CONF_USAGE_DEADBAND,
+    DEFAULT_IMPORT_STATISTICS,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DEFAULT_USAGE_DEADBAND,
+    ENDPOINTS,
+    TIER_INFO,
+    TIER_STATUS,
+)
+from .entity import (
+    MyCloudDiskEntity,
+    MyCloudEntity,
+    MyCloudVolumeEntity,
+    async_setup_hardware_entities,
+    disk_device_info,
+    nas_device_info,
+    volume_device_info,
+    volume_key,
+)
 
 
 _LOGGER = logging.getLogger(__name__)
 
-async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities):
-    """Set up the WD My Cloud sensor platform."""
-    host = config_entry.data["Host"]
-    username = config_entry.data["Username"]
-    password = config_entry.data["Password"]
-    version = config_entry.data["Version"]
-
-    client = nas_client(username, password, host, version)
-    
-    await client.__aenter__()
-
-    update_interval_seconds = config_entry.options.get("update_interval", 600)
-    SCAN_INTERVAL = timedelta(seconds=update_interval_seconds)
-    _LOGGER.debug("Update interval set to %s seconds", update_interval_seconds)
-
-
-    async def async_update_data():
-        """Fetch data from the device and re-authenticate if session expires."""
-
-        async def _fetch_data_from_api():
-            """Helper function to fetch all data points from the API."""
-            return {
-                "system_info": await client.system_info(),
-                "system_status": await client.system_status(),
-                "device_info": await client.device_info(),
-                "system_version": await client.system_version(),
-            }
-
-        try:
-            return await _fetch_data_from_api()
-        
-        except Exception as err:
-            if "403" in str(err):
-                try:
-                    await client.__aenter__()
-                    
-                    _LOGGER.debug("Re-authentication successful. Retrying data fetch.")
-                    return await _fetch_data_from_api()
-
-                except Exception as retry_err:
-                    _LOGGER.error("Failed to fetch data after re-authentication: %s", retry_err)
-                    raise UpdateFailed(f"Failed to fetch data after re-auth: {retry_err}")
-            
-            else:
-                _LOGGER.error("Error fetching data: %s", err)
-                raise UpdateFailed(f"Error fetching data: {err}")
-
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name="mycloud_coordinator",
-        update_method=async_update_data,
-        update_interval=SCAN_INTERVAL,
-    )
 
-    await coordinator.async_refresh()
+@dataclass(frozen=True, kw_only=True)
+class MyCloudSensorEntityDescription(SensorEntityDescription):
+    """Describes a My Cloud sensor.
+
+    `value_fn` receives the coordinator data for NAS sensors, or the `Disk`
+    or `Volume` for disk and volume sensors.
+    """
+
+    value_fn: Callable[[Any], Any]
+    tier: str = TIER_INFO
+    deadband_option: str | None = None
+    reports_stale: bool = False
+    # Imported hourly by HourlyStatistics when that option is on.
+    long_term_statistic: bool = False
 
-    device_info_data = coordinator.data["device_info"]
-    system_version_data = coordinator.data["system_version"]
-    serial_number = device_info_data["serial_number"]
-    device_name = device_info_data["name"]
 
-    device = DeviceInfo(
-        identifiers={(DOMAIN, serial_number)},
-        name=device_name,
-        manufacturer="Western Digital",
-        model=device_info_data["description"],
-        sw_version=system_version_data["firmware"]
+def _scale(value, factor):
+    return None if value is None else value * factor
+
+
+def _storage(key, name, icon, value_fn, long_term_statistic=False):
+    return MyCloudSensorEntityDescription(
+        key=key,
+        name=name,
+        icon=icon,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.TERABYTES,
+        long_term_statistic=long_term_statistic,
+        value_fn=value_fn,
     )
 
-    sensors_to_add = [
-        MyCloudCPUSensor(coordinator, device, serial_number, device_name),
-        MyCloudMemorySensor(coordinator, device, serial_number, device_name),
-        MyCloudTotalStorageSensor(coordinator, device, serial_number, device_name),
-        MyCloudUsedStorageSensor(coordinator, device, serial_number, device_name),
-        MyCloudUnusedStorageSensor(coordinator, device, serial_number, device_name)
-    ]
 
-    disks = coordinator.data["system_info"]["disks"]
-    for disk in disks:
-        disk_serial = disk["sn"]
-        disk_name = f"{device_name} Disk {disk['name']}"
-        disk_model = disk["model"]
-
-        disk_device = DeviceInfo(
-            identifiers={(DOMAIN, disk_serial)},
-            name=disk_name,
-            manufacturer="Western Digital",
-            model=disk_model,
-            sw_version=system_version_data["firmware"],
-            hw_version=disk["rev"],
-            via_device=(DOMAIN, serial_number)
-        )
+SYSTEM_SENSORS = (
+    MyCloudSensorEntityDescription(
+        key="cpu_usage",
+        name="CPU Usage",
+        icon="mdi:cpu-64-bit",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        tier=TIER_STATUS,
+        deadband_option=CONF_USAGE_DEADBAND,
+        value_fn=lambda data: data["system_status"].cpu,
+    ),
+    MyCloudSensorEntityDescription(
+        key="memory_usage",
+        name="Memory Usage",
+        icon="mdi:memory",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        tier=TIER_STATUS,
+        deadband_option=CONF_USAGE_DEADBAND,
+        value_fn=lambda data: data["system_status"].memory,
+    ),
+    _storage("total_storage", "Total Storage", "mdi:database", lambda data: data["system_info"].total),
+    _storage("used_storage", "Used Storage", "mdi:database-minus", lambda data: data["system_info"].used, True),
+    _storage("unused_storage", "Unused Storage", "mdi:database-plus", lambda data: data["system_info"].unused),
+    MyCloudSensorEntityDescription(
+        key="storage_growth_rate",
+        name="Storage Growth Rate",
+        icon="mdi:chart-line",
+        native_unit_of_measurement=f"{UnitOfInformation.GIGABYTES}/{UnitOfTime.DAYS}",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        value_fn=lambda data: _scale(data["forecast"].growth_rate, 1e-9),
+    ),
+    MyCloudSensorEntityDescription(
+        key="storage_time_to_full",
+        name="Storage Time to Full",
+        icon="mdi:database-clock",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.DAYS,
+        suggested_display_precision=0,
+        value_fn=lambda data: data["forecast"].time_to_full,
+    ),
+)
+
+def _summary(metric, name, icon, stat, stat_name):
+    return MyCloudSensorEntityDescription(
+        key=f"{metric}_usage_{stat}",
+        name=f"{name} Usage {stat_name}",
+        icon=icon,
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        tier=TIER_STATUS,
+        deadband_option=CONF_USAGE_DEADBAND,
+        value_fn=lambda data: getattr(data["status_summary"][metric], stat, None),
+    )
 
-        sensors_to_add.extend([
-            MyCloudDiskTempSensor(coordinator, disk_device, disk_serial, disk_name, disk),
-            MyCloudDiskHealthySensor(coordinator, disk_device, disk_serial, disk_name, disk),
-            MyCloudDiskSleepSensor(coordinator, disk_device, disk_serial, disk_name, disk),
-            MyCloudDiskFailedSensor(coordinator, disk_device, disk_serial, disk_name, disk),
-            MyCloudDiskOverTempSensor(coordinator, disk_device, disk_serial, disk_name, disk),
-            MyCloudDiskSizeSensor(coordinator, disk_device, disk_serial, disk_name, disk)
-        ])
-    
-    volumes = coordinator.data["system_info"]["volumes"]
-    for volume in volumes:
-        volume_id = volume["id"]
-        volume_name = f"{device_name} {volume['label']}"
-
-        volume_device = DeviceInfo(
-            identifiers={(DOMAIN, volume_id)},
-            name=volume_name,
-            manufacturer="Western Digital",
-            model="Storage Volume",
-            via_device=(DOMAIN, serial_number)
-        )
 
-        sensors_to_add.extend([
-            MyCloudVolumeSizeSensor(coordinator, volume_device, volume_name, volume),
-            MyCloudVolumeMountedSensor(coordinator, volume_device, volume_name, volume),
-            MyCloudVolumeUnlockedSensor(coordinator, volume_device, volume_name, volume),
-            MyCloudVolumeEncryptedSensor(coordinator, volume_device, volume_name, volume)
-        ])
+# Only created when fast sampling is enabled.
+SUMMARY_SENSORS = tuple(
+    _summary(metric, name, icon, stat, stat_name)
+    for metric, name, icon in (("cpu", "CPU", "mdi:cpu-64-bit"), ("memory", "Memory", "mdi:memory"))
+    for stat, stat_name in (("min", "Min"), ("max", "Max"), ("mean", "Mean"), ("p95", "95th Percentile"))
+)
+
+DISK_SENSORS = (
+    MyCloudSensorEntityDescription(
+        key="disk_temp",
+        name="Temperature",
+        icon="mdi:thermometer",
+        device_class=SensorDeviceClass.TEMPERATURE,
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband_option=CONF_TEMPERATURE_DEADBAND,
+        reports_stale=True,
+        long_term_statistic=True,
+        value_fn=lambda disk: disk.temp,
+    ),
+    MyCloudSensorEntityDescription(
+        key="disk_size",
+        name="Size",
+        icon="mdi:harddisk",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        suggested_unit_of_measurement=UnitOfInformation.TERABYTES,
+        reports_stale=True,
+        value_fn=lambda disk: disk.size,
+    ),
+)
+
+VOLUME_SENSORS = (
+    _storage("volume_size", "Size", "mdi:harddisk", lambda volume: volume.size, True),
+)
 
-    async_add_entities(sensors_to_add, True)
 
-    hass.data[DOMAIN]["client_cleanup"] = client.__aexit__
+async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry, async_add_entities):
+    """Set up the WD My Cloud sensor platform."""
+    data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinators = data.coordinators
+    topology = data.topology
 
+    status_coordinator = coordinators[TIER_STATUS]
+    coordinator = coordinators[TIER_INFO]
 
-async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry):
-    """Unload a config entry."""
-    client_cleanup = hass.data[DOMAIN].get("client_cleanup")
-    if client_cleanup:
-        await client_cleanup(None, None, None)
-    return True
+    serial_number = topology.serial_number
+    device_name = topology.name
+    device = nas_device_info(topology)
 
-class MyCloudSensorBase(CoordinatorEntity, SensorEntity):
-    def __init__(self, coordinator, device_info, serial_number, device_name, key, name, unit=None, device_class=None):
-        super().__init__(coordinator)
-        self._attr_device_info = device_info
-        self._attr_unique_id = f"{serial_number}_{key}"
-        self._attr_name = f"{device_name} {name}"
-        self._attr_native_unit_of_measurement = unit
-        self._attr_device_class = device_class
-        self._attr_state_class = SensorStateClass.MEASUREMENT
+    deadbands = {
+        CONF_USAGE_DEADBAND: config_entry.options.get(CONF_USAGE_DEADBAND, DEFAULT_USAGE_DEADBAND),
+        CONF_TEMPERATURE_DEADBAND: config_entry.options.get(CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND),
+    }
 
-# -- System --
+    import_statistics = config_entry.options.get(CONF_IMPORT_STATISTICS, DEFAULT_IMPORT_STATISTICS)
+    disk_descriptions = _descriptions(DISK_SENSORS, import_statistics)
+    volume_descriptions = _descriptions(VOLUME_SENSORS, import_statistics)
 
-class MyCloudCPUSensor(MyCloudSensorBase):
-    def __init__(self, coordinator, device_info, serial_number, device_name):
-        super().__init__(
-            coordinator,
-            device_info,
-            serial_number,
-            device_name,
-            "cpu_usage",
-            "CPU Usage",
-            unit="%"
-        )
-        self._attr_icon = "mdi:cpu-64-bit"
+    sensors_to_add = [
+        MyCloudSensor(coordinators[description.tier], description, device, serial_number, device_name, deadbands)
+        for description in _descriptions(SYSTEM_SENSORS, import_statistics)
+    ]
 
-    @property
-    def state(self):
-        return self.coordinator.data["system_status"]["cpu"]
+    if status_coordinator.sample_interval:
+        sensors_to_add.extend(
+            MyCloudSensor(status_coordinator, description, device, serial_number, device_name, deadbands)
+            for description in SUMMARY_SENSORS
+        )
 
-class MyCloudMemorySensor(MyCloudSensorBase):
-    def __init__(self, coordinator, device_info, serial_number, device_name):
-        super().__init__(
-            coordinator,
-            device_info,
-            serial_number,
-            device_name,
-            "memory_usage",
-            "Memory Usage",
-            unit="%"
+    for endpoint in ENDPOINTS:
+        sensors_to_add.append(
+            MyCloudEndpointLatencySensor(status_coordinator, data.api.stats, device, serial_number, device_name, endpoint)
         )
-        self._attr_icon = "mdi:memory"
+    sensors_to_add.extend([
+        MyCloudReauthCountSensor(status_coordinator, data.api.stats, device, serial_number, device_name),
+        MyCloudFailedRequestsSensor(status_coordinator, data.api.stats, device, serial_number, device_name),
+    ])
+
+    async_add_entities(sensors_to_add)
+
+    async_setup_hardware_entities(
+        config_entry,
+        coordinator,
+        topology,
+        async_add_entities,
+        lambda disk: _disk_sensors(coordinator, topology, disk, disk_descriptions, deadbands),
+        lambda volume: _volume_sensors(coordinator, topology, volume, volume_descriptions),
+    )
 
-    @property
-    def state(self):
-        mem_data = self.coordinator.data["system_status"]["memory"]
-        total = mem_data["total"]
-        used = total - mem_data["unused"]
-        if total > 0:
-            return round((used / total) * 100, 2)
-        return None
-    
-class MyCloudTotalStorageSensor(CoordinatorEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.DATA_SIZE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
 
-    _attr_suggested_unit_of_measurement = UnitOfInformation.TERABYTES
-    _attr_icon = "mdi:database"
-    
+def _descriptions(descriptions, import_statistics):
+    """Drop the state class of sensors whose hourly statistics are imported directly.
 
-    def __init__(self, coordinator, device_info, serial_number, device_name):
-        super().__init__(coordinator)
-        self._attr_device_info = device_info
-        self._attr_unique_id = f"{serial_number}_total_storage"
-        self._attr_name = f"{device_name} Total Storage"
+    Otherwise the recorder would compile the same statistics from their states.
+    """
+    if not import_statistics:
+        return descriptions
+    return tuple(
+        replace(description, state_class=None) if description.long_term_statistic else description
+        for description in descriptions
+    )
 
-    @property
-    def native_value(self):
-        size_data = self.coordinator.data["system_info"]["size"]
-        return int(size_data["total"])
 
-class MyCloudUsedStorageSensor(CoordinatorEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.DATA_SIZE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
+def _disk_sensors(coordinator, topology, disk, descriptions, deadbands):
+    disk_name = f"{topology.name} Disk {disk.name}"
+    disk_device = disk_device_info(topology, disk)
+    return [
+        MyCloudDiskSensor(coordinator, description, disk_device, disk.serial, disk_name, deadbands)
+        for description in descriptions
+    ]
 
-    _attr_suggested_unit_of_measurement = UnitOfInformation.TERABYTES
-    _attr_icon = "mdi:database-minus"
 
-    def __init__(self, coordinator, device_info, serial_number, device_name):
-        super().__init__(coordinator)
-        self._attr_device_info = device_info
-        self._attr_unique_id = f"{serial_number}_used_storage"
-        self._attr_name = f"{device_name} Used Storage"
+def _volume_sensors(coordinator, topology, volume, descriptions):
+    volume_name = f"{topology.name} {volume.label}"
+    volume_device = volume_device_info(topology, volume)
+    return [
+        MyCloudVolumeSensor(coordinator, description, volume_device, topology, volume.id, volume_name)
+        for description in descriptions
+    ]
 
-    @property
-    def native_value(self):
-        size_data = self.coordinator.data["system_info"]["size"]
-        return int(size_data["used"])
 
-class MyCloudUnusedStorageSensor(CoordinatorEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.DATA_SIZE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
+class MyCloudSensor(MyCloudEntity, SensorEntity):
+    """NAS-wide sensor described by a `MyCloudSensorEntityDescription`."""
 
-    _attr_suggested_unit_of_measurement = UnitOfInformation.TERABYTES
-    _attr_icon = "mdi:database-plus"
+    entity_description: MyCloudSensorEntityDescription
 
-    def __init__(self, coordinator, device_info, serial_number, device_name):
-        super().__init__(coordinator)
+    def __init__(self, coordinator, description, device_info, serial_number, device_name, deadbands):
+        super().__init__(coordinator, deadbands.get(description.deadband_option, 0))
+        self.entity_description = description
         self._attr_device_info = device_info
-        self._attr_unique_id = f"{serial_number}_unused_storage"
-        self._attr_name = f"{device_name} Unused Storage"
-
-    @property
-    def native_value(self):
-        size_data = self.coordinator.data["system_info"]["size"]
-        return int(size_data["unused"])
+        self._attr_unique_id = f"{serial_number}_{description.key}"
+        self._attr_name = f"{device_name} {description.name}"
 
-# -- Disks --
+    def _update_from_data(self):
+        self._attr_native_value = self.entity_description.value_fn(self.coordinator.data)
 
-class MyCloudDiskTempSensor(CoordinatorEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.TEMPERATURE
-    _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_icon = "mdi:thermometer"
+class MyCloudDiskSensor(MyCloudDiskEntity, SensorEntity):
+    entity_description: MyCloudSensorEntityDescription
 
-    def __init__(self, coordinator, device_info, serial_number, disk_name, disk):
-        super().__init__(coordinator)
+    def __init__(self, coordinator, description, device_info, disk_serial, disk_name, deadbands):
+        super().__init__(coordinator, disk_serial, deadbands.get(description.deadband_option, 0))
+        self.entity_description = description
         self._attr_device_info = device_info
-        self._attr_unique_id = f"{serial_number}_disk_temp"
-        self._attr_name = f"{disk_name} Temperature"
-        self._disk_name = disk['name']
+        self._attr_unique_id = f"{disk_serial}_{description.key}"
+        self._attr_name = f"{disk_name} {description.name}"
 
-    @property
-    def native_value(self):
-        disks = self.coordinator.data.get("system_info", {}).get("disks", [])
-        for disk in disks:
-            if disk["name"] == self._disk_name:
-                try:
-                    return float(disk["temp"])
-                except (TypeError, ValueError):
-                    return None
-        return None
-
-class MyCloudDiskSizeSensor(CoordinatorEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.DATA_SIZE
-    _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
+    def _update_from_data(self):
+        self._attr_native_value = self.entity_description.value_fn(self._disk)
+        if self.entity_description.reports_stale:
+            self._attr_extra_state_attributes = {"stale": self._disk_serial in self.coordinator.stale_disks}
 
-    _attr_suggested_unit_of_measurement = UnitOfInformation.TERABYTES
-    _attr_icon = "mdi:harddisk"
+class MyCloudVolumeSensor(MyCloudVolumeEntity, SensorEntity):
+    entity_description: MyCloudSensorEntityDescription
 
-    def __init__(self, coordinator, device_info, serial_number, disk_name, disk):
-        super().__init__(coordinator)
+    def __init__(self, coordinator, description, device_info, topology, volume_id, volume_name):
+        super().__init__(coordinator, volume_id)
+        self.entity_description = description
         self._attr_device_info = device_info
-        self._attr_unique_id = f"{serial_number}_disk_size"
-        self._attr_name = f"{disk_name} Size"
-        self._disk_name = disk['name']
+        self._attr_unique_id = f"{volume_key(topology, volume_id)}_{description.key}"
+        self._attr_name = f"{volume_name} {description.name}"
 
-    @property
-    def native_value(self):
-        disks = self.coordinator.data["system_info"]["disks"]
-        for disk in disks:
-            if disk["name"] == self._disk_name:
-                return int(disk["size"])
-        return None
-    
-class MyCloudDiskHealthySensor(CoordinatorEntity, BinarySensorEntity):
-    _attr_icon = "mdi:shield-check"
-    def __init__(self, coordinator, device_info, serial_number, disk_name, disk):
-        super().__init__(coordinator)
-        self._attr_device_info = device_info
-        self._attr_unique_id = f"{serial_number}_disk_healthy"
-        self._attr_name = f"{disk_name} Healthy"
-        self._disk_name = disk['name']
+    def _update_from_data(self):
+        self._attr_native_value = self.entity_description.value_fn(self._volume)
 
-    @property
-    def is_on(self):
-        disks = self.coordinator.data["system_info"]["disks"]
-        for disk in disks:
-            if disk["name"] == self._disk_name:
-                return disk["healthy"]
-        return False
-
-class MyCloudDiskSleepSensor(CoordinatorEntity, BinarySensorEntity):
-    _attr_icon = "mdi:sleep"
-    def __init__(self, coordinator, device_info, serial_number, disk_name, disk):
-        super().__init__(coordinator)
-        self._attr_device_info = device_info
-        self._attr_unique_id = f"{serial_number}_disk_sleep"
-        self._attr_name = f"{disk_name} Sleeping"
-        self._disk_name = disk['name']
+# -- Diagnostics --
 
-    @property
-    def is_on(self):
-        disks = self.coordinator.data["system_info"]["disks"]
-        for disk in disks:
-            if disk["name"] == self._disk_name:
-                return disk["sleep"]
-        return False
-
-class MyCloudDiskFailedSensor(CoordinatorEntity, BinarySensorEntity):
-    _attr_icon = "mdi:alert"
-    def __init__(self, coordinator, device_info, serial_number, disk_name, disk):
-        super().__init__(coordinator)
-        self._attr_device_info = device_info
-        self._attr_unique_id = f"{serial_number}_disk_failed"
-        self._attr_name = f"{disk_name} Failed"
-        self._disk_name = disk['name']
+class MyCloudDiagnosticSensorBase(MyCloudEntity, SensorEntity):
+    """Poll performance sensor, refreshed along with the CPU/memory tier."""
 
-    @property
-    def is_on(self):
-        disks = self.coordinator.data["system_info"]["disks"]
-        for disk in disks:
-            if disk["name"] == self._disk_name:
-                return disk["failed"]
-        return False
-
-class MyCloudDiskOverTempSensor(CoordinatorEntity, BinarySensorEntity):
-    _attr_icon = "mdi:thermometer-alert"
-    def __init__(self, coordinator, device_info, serial_number, disk_name, disk):
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator, stats, device_info, serial_number, device_name, key, name):
         super().__init__(coordinator)
+        self._stats = stats
         self._attr_device_info = device_info
-        self._attr_unique_id = f"{serial_number}_disk_over_temp"
-        self._attr_name = f"{disk_name} Over Temperature"
-        self._disk_name = disk['name']
+        self._attr_unique_id = f"{serial_number}_{key}"
+        self._attr_name = f"{device_name} {name}"
 
     @property
-    def is_on(self):
-        disks = self.coordinator.data["system_info"]["disks"]
-        for disk in disks:
-            if disk["name"] == self._disk_name:
-                return disk["over_temp"]
-        return False
+    def available(self):
+        return True
 
-# -- Volumes --
-
-class MyCloudVolumeSizeSensor(CoordinatorEntity, SensorEntity):
-    _attr_device_class = SensorDeviceClass.DATA_SIZE
+class MyCloudEndpointLatencySensor(MyCloudDiagnosticSensorBase):
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
     _attr_state_class = SensorStateClass.MEASUREMENT
-    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
-
-    _attr_suggested_unit_of_measurement = UnitOfInformation.TERABYTES
-    _attr_icon = "mdi:harddisk"
+    _attr_icon = "mdi:timer-outline"
 
-    def __init__(self, coordinator, device_info, volume_name, volume):
-        super().__init__(coordinator)
-        self._attr_device_info = device_info
-        self._attr_unique_id = f"{volume['id']}_volume_size"
-        self._attr_name = f"{volume_name} Size"
-        self._volume_id = volume['id']
+    def __init__(self, coordinator, stats, device_info, serial_number, device_name, endpoint):
+        super().__init__(
+            coordinator,
+            stats,
+            device_info,
+            serial_number,
+            device_name,
+            f"{endpoint}_latency",
+            f"{endpoint.replace('_', ' ').title()} Latency",
+        )
+        self._endpoint = endpoint
 
     @property
     def native_value(self):
-        volumes = self.coordinator.data.get("system_info", {}).get("volumes", [])
-        for volume in volumes:
-            if volume["id"] == self._volume_id:
-                try:
-                    return int(volume["size"])
-                except (TypeError, ValueError):
-                    return None
-        return None
-
-class MyCloudVolumeMountedSensor(CoordinatorEntity, BinarySensorEntity):
-    _attr_icon = "mdi:folder-pound"
-
-    def __init__(self, coordinator, device_info, volume_name, volume):
-        super().__init__(coordinator)
-        self._attr_device_info = device_info
-        self._attr_unique_id = f"{volume_name}_volume_mounted"
-        self._attr_name = f"{volume_name} Mounted"
-        self._volume_name = volume['name']
+        return self._stats.endpoint(self._endpoint).last
 
     @property
-    def is_on(self):
-        volumes = self.coordinator.data["system_info"]["volumes"]
-        for volume in volumes:
-            if volume["name"] == self._volume_name:
-                return volume["mounted"]
-        return False
+    def extra_state_attributes(self):
+        stats = self._stats.endpoint(self._endpoint)
+        return {
+            "p50": stats.percentile(50),
+            "p95": stats.percentile(95),
+            "calls": stats.calls,
+            "failures": stats.failures,
+            "payload_bytes": stats.payload_bytes,
+        }
+
+class MyCloudReauthCountSensor(MyCloudDiagnosticSensorBase):
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:account-key"
+
+    def __init__(self, coordinator, stats, device_info, serial_number, device_name):
+        super().__init__(coordinator, stats, device_info, serial_number, device_name, "reauth_count", "Re-authentications")
 
-class MyCloudVolumeUnlockedSensor(CoordinatorEntity, BinarySensorEntity):
-    _attr_icon = "mdi:lock-open"
+    @property
+    def native_value(self):
+        return self._stats.reauth_count
 
-    def __init__(self, coordinator, device_info, volume_name, volume):
-        super().__init__(coordinator)
-        self._attr_device_info = device_info
-        self._attr_unique_id = f"{volume_name}_volume_unlocked"
-        self._attr_name = f"{volume_name} Unlocked"
-        self._volume_name = volume['name']
+class MyCloudFailedRequestsSensor(MyCloudDiagnosticSensorBase):
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:alert-circle-outline"
 
-    @property
-    def is_on(self):
-        volumes = self.coordinator.data["system_info"]["volumes"]
-        for volume in volumes:
-            if volume["name"] == self._volume_name:
-                return volume["unlocked"]
-        return False
-        
-class MyCloudVolumeEncryptedSensor(CoordinatorEntity, BinarySensorEntity):
-    _attr_icon = "mdi:lock"
-
-    def __init__(self, coordinator, device_info, volume_name, volume):
-        super().__init__(coordinator)
-        self._attr_device_info = device_info
-        self._attr_unique_id = f"{volume_name}_volume_encrypted"
-        self._attr_name = f"{volume_name} Encrypted"
-        self._volume_name = volume['name']
+    def __init__(self, coordinator, stats, device_info, serial_number, device_name):
+        super().__init__(coordinator, stats, device_info, serial_number, device_name, "failed_requests", "Failed Requests")
 
     @property
-    def is_on(self):
-        volumes = self.coordinator.data["system_info"]["volumes"]
-        for volume in volumes:
-            if volume["name"] == self._volume_name:
-                return volume["encrypted"]
-        return False
\ No newline at end of file
+    def native_value(self):
+        return self._stats.failures
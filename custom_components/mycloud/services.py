@@ -0,0 +1,82 @@
+import asyncio
+import logging
+import time
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_AREA_ID, ATTR_DEVICE_ID, ATTR_ENTITY_ID, ENTITY_MATCH_ALL
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.service import async_extract_config_entry_ids
+
+from .const import ATTR_ENDPOINTS, DOMAIN, ENDPOINTS, REFRESH_COOLDOWN, SERVICE_REFRESH, TIER_ENDPOINTS
+from .coordinator import MyCloudData
+
+_LOGGER = logging.getLogger(__name__)
+
+REFRESH_SCHEMA = vol.Schema(
+    {
+        **cv.ENTITY_SERVICE_FIELDS,
+        vol.Optional(ATTR_ENDPOINTS): vol.All(cv.ensure_list, [vol.In(ENDPOINTS)]),
+    }
+)
+
+
+async def _async_target_entries(hass: HomeAssistant, call: ServiceCall) -> list[MyCloudData]:
+    """Return the loaded entries for the targeted devices, entities or areas, or every entry."""
+    loaded = {
+        entry_id: data for entry_id, data in hass.data.get(DOMAIN, {}).items() if isinstance(data, MyCloudData)
+    }
+    if call.data.get(ATTR_ENTITY_ID) == ENTITY_MATCH_ALL or not any(
+        key in call.data for key in (ATTR_ENTITY_ID, ATTR_DEVICE_ID, ATTR_AREA_ID)
+    ):
+        return list(loaded.values())
+
+    entry_ids = await async_extract_config_entry_ids(hass, call) & loaded.keys()
+    if not entry_ids:
+        raise ServiceValidationError("The target doesn't include a loaded My Cloud device")
+    return [loaded[entry_id] for entry_id in entry_ids]
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the `mycloud.refresh` service."""
+
+    async def _async_refresh(call: ServiceCall) -> None:
+        """Refresh the tiers holding the requested endpoints, now.
+
+        Concurrent calls, and polls already running, join the tier's refresh
+        in progress instead of starting another, and tiers that refreshed
+        successfully in the last `REFRESH_COOLDOWN` seconds aren't refreshed
+        again. Fails if a requested endpoint couldn't be fetched, including
+        when its last good value was kept instead.
+        """
+        endpoints = set(call.data.get(ATTR_ENDPOINTS) or ENDPOINTS)
+        targets = [
+            (data.topology.name, coordinator)
+            for data in await _async_target_entries(hass, call)
+            for tier, coordinator in data.coordinators.items()
+            if endpoints.intersection(TIER_ENDPOINTS[tier])
+        ]
+        now = time.monotonic()
+        due = [
+            (name, coordinator)
+            for name, coordinator in targets
+            if not coordinator.last_update_success
+            or coordinator.refreshed_at is None
+            or now - coordinator.refreshed_at >= REFRESH_COOLDOWN
+            or endpoints & coordinator.stale_endpoints
+        ]
+        _LOGGER.debug("Refreshing %s on request", ", ".join(f"{name} {coordinator.tier}" for name, coordinator in due))
+        await asyncio.gather(*(coordinator.async_refresh() for _, coordinator in due))
+
+        failed = []
+        for name, coordinator in targets:
+            if not coordinator.last_update_success:
+                failed.append(f"{name} {coordinator.tier}")
+            elif stale := endpoints & coordinator.stale_endpoints:
+                failed.extend(f"{name} {endpoint} (kept last good value)" for endpoint in sorted(stale))
+        if failed:
+            raise HomeAssistantError(f"Refresh failed: {', '.join(failed)}")
+
+    hass.services.async_register(DOMAIN, SERVICE_REFRESH, _async_refresh, schema=REFRESH_SCHEMA)
@@ -0,0 +1,104 @@
+from collections import deque
+from contextvars import ContextVar
+from statistics import quantiles
+
+import aiohttp
+
+from .const import LATENCY_SAMPLES
+
+# The call currently in flight in this task, so response sizes can be
+# attributed to the endpoint that requested them.
+_CURRENT_CALL = ContextVar("mycloud_current_call", default=None)
+
+
+class CallTrace:
+    __slots__ = ("payload_bytes",)
+
+    def __init__(self):
+        self.payload_bytes = 0
+
+
+class EndpointStats:
+    """Latency, failure and payload size counters for one endpoint."""
+
+    __slots__ = ("latencies", "calls", "failures", "payload_bytes")
+
+    def __init__(self):
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.calls = 0
+        self.failures = 0
+        self.payload_bytes = None
+
+    @property
+    def last(self):
+        return self.latencies[-1] if self.latencies else None
+
+    def percentile(self, percent):
+        if not self.latencies:
+            return None
+        if len(self.latencies) == 1:
+            return self.latencies[0]
+        return quantiles(self.latencies, n=100, method="inclusive")[percent - 1]
+
+    def as_dict(self):
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "last_ms": self.last,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "payload_bytes": self.payload_bytes,
+        }
+
+
+class PollStats:
+    """Per-endpoint poll performance for one NAS."""
+
+    def __init__(self):
+        self.endpoints = {}
+        self.reauth_count = 0
+
+    def endpoint(self, endpoint):
+        if endpoint not in self.endpoints:
+            self.endpoints[endpoint] = EndpointStats()
+        return self.endpoints[endpoint]
+
+    @property
+    def failures(self):
+        return sum(stats.failures for stats in self.endpoints.values())
+
+    def start_call(self):
+        """Start attributing response bytes to a new call in the current task."""
+        trace = CallTrace()
+        _CURRENT_CALL.set(trace)
+        return trace
+
+    def record_call(self, endpoint, duration, success, trace):
+        stats = self.endpoint(endpoint)
+        stats.calls += 1
+        stats.latencies.append(round(duration * 1000, 1))
+        if success:
+            stats.payload_bytes = trace.payload_bytes
+        else:
+            stats.failures += 1
+
+    def record_reauth(self):
+        self.reauth_count += 1
+
+    def trace_config(self):
+        """Return an aiohttp trace config that measures response payload sizes."""
+
+        async def _on_response_chunk_received(session, context, params):
+            trace = _CURRENT_CALL.get()
+            if trace is not None:
+                trace.payload_bytes += len(params.chunk)
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_response_chunk_received.append(_on_response_chunk_received)
+        return trace_config
+
+    def as_dict(self):
+        return {
+            "reauth_count": self.reauth_count,
+            "endpoints": {endpoint: stats.as_dict() for endpoint, stats in self.endpoints.items()},
+        }
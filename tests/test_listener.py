@@ -0,0 +1,85 @@
+"""Tests for recognising NAS alerts in syslog messages and SNMP traps."""
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.mycloud.listener import (
+    EVENT_DISK_FAILED,
+    EVENT_DISK_OVER_TEMP,
+    EVENT_VOLUME_UNMOUNTED,
+    NasEvent,
+    _apply_event,
+    is_snmp,
+    parse_event,
+)
+from custom_components.mycloud.model import SystemInfo
+
+# An SNMPv2c trap with community "public" and no variable bindings.
+SNMP_TRAP = bytes.fromhex("301b02010104067075626c6963a70e0204123456780201000201003000")
+
+
+@pytest.mark.parametrize(
+    ("message", "event"),
+    [
+        ("<130>Oct 18 10:00:00 MyCloudEX2 alert: Drive 2 has failed.", NasEvent(EVENT_DISK_FAILED, "2")),
+        ("<11>Drive Failure: Drive 1", NasEvent(EVENT_DISK_FAILED, "1")),
+        ("<11>Disk 3 SMART test failed", NasEvent(EVENT_DISK_FAILED, "3")),
+        ("<12>Drive 4 temperature is too high", NasEvent(EVENT_DISK_OVER_TEMP, "4")),
+        ("<12>Drive 1 is over temperature", NasEvent(EVENT_DISK_OVER_TEMP, "1")),
+        ("<12>Disk 2 overheating", NasEvent(EVENT_DISK_OVER_TEMP, "2")),
+        ("<11>Volume_1 is not mounted", NasEvent(EVENT_VOLUME_UNMOUNTED, "Volume_1")),
+        ("<11>Volume 2 failed to mount", NasEvent(EVENT_VOLUME_UNMOUNTED, "Volume 2")),
+        ("Volume_1 was unmounted", NasEvent(EVENT_VOLUME_UNMOUNTED, "Volume_1")),
+    ],
+)
+def test_parse_alert(message, event):
+    assert parse_event(message) == event
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "<11>Disk 1 SMART test passed, no failure detected",
+        "<11>Disk 3 temperature back to normal from critical",
+        "<12>Drive 2 temperature returned to normal",
+        "<13>Drive 1 recovered after failed read retry",
+        "<13>Volume_1 mounted",
+        "<86>sshd[1234]: Failed password for admin from 192.168.1.20",
+        "<78>CRON[99]: (root) CMD (/usr/sbin/disk_check 1) failed with status 1",
+        "<14>Disk 2 is healthy. Backup job failed.",
+        "<14>User admin logged in",
+    ],
+)
+def test_ignore_benign(message):
+    assert parse_event(message) is None
+
+
+def test_is_snmp():
+    assert is_snmp(SNMP_TRAP)
+    assert not is_snmp(SNMP_TRAP[:-1])
+    assert not is_snmp(b"<11>Drive 2 has failed")
+    assert not is_snmp(b"0 Drive 2 has failed")
+
+
+def _disk(bay, name, serial):
+    return {
+        "id": bay, "name": name, "sn": serial, "model": "WD40EFRX", "rev": "82.00A82", "size": "4000787030016",
+        "temp": "30", "healthy": True, "sleep": False, "failed": False, "over_temp": False,
+    }
+
+
+def test_apply_event_matches_bay():
+    info = SystemInfo.from_api(
+        {
+            "disks": [_disk("1", "sda", "WD-0001"), _disk("2", "sdb", "WD-0002")],
+            "volumes": [],
+            "size": {"total": None, "used": None, "unused": None},
+        }
+    )
+    coordinator = SimpleNamespace(data={"system_info": info})
+
+    assert _apply_event(coordinator, NasEvent(EVENT_DISK_FAILED, "2"))
+    assert info.disks["WD-0002"].failed and not info.disks["WD-0002"].healthy
+    assert not info.disks["WD-0001"].failed
+    assert not _apply_event(coordinator, NasEvent(EVENT_DISK_FAILED, "2"))
+    assert not _apply_event(coordinator, NasEvent(EVENT_DISK_OVER_TEMP, "sda"))